@@ -11,15 +11,16 @@ Usage:
 
 import argparse
 import sys
-from hypersdk import HyperSDK
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from hypersdk import HyperSDK
 
-def compare_cloud_costs(api_url: str, disk_size_gb: float, duration_days: int,
+
+def compare_cloud_costs(client: "HyperSDK", disk_size_gb: float, duration_days: int,
                         format: str = "ova", include_snapshots: bool = False):
     """Compare cloud storage costs across providers"""
 
-    client = HyperSDK(api_url)
-
     print(f"☁️  Cloud Storage Cost Comparison\n")
     print(f"Parameters:")
     print(f"  Disk Size: {disk_size_gb} GB")
@@ -53,15 +54,18 @@ def compare_cloud_costs(api_url: str, disk_size_gb: float, duration_days: int,
             storage_gb=export_size,
             transfer_gb=0,  # No downloads planned
             requests=1000,  # Estimated API requests
-            duration_days=duration_days
+            duration_days=duration_days,
+            sort_by="total_cost",  # Cheapest first
         )
 
         print(f"\nCost Comparison ({duration_days} days):\n")
         print(f"{'Provider':<15} {'Storage Class':<20} {'Total Cost':<15} {'Monthly':<15}")
         print("-" * 65)
 
-        for estimate in sorted(comparison['estimates'],
-                               key=lambda x: x['total_cost']):
+        # Ordered by total cost (sort_by above), cheapest first
+        estimates = comparison['estimates']
+
+        for estimate in estimates:
             provider = estimate['provider']
             storage_class = estimate['storage_class']
             total = estimate['total_cost']
@@ -76,10 +80,9 @@ def compare_cloud_costs(api_url: str, disk_size_gb: float, duration_days: int,
         print(f"💵 Savings vs most expensive: ${comparison['savings_vs_expensive']:.2f}")
 
         # Step 3: Detailed breakdown for cheapest option
-        cheapest = next(e for e in comparison['estimates']
-                        if e['provider'] == comparison['cheapest'])
+        cheapest = estimates[0]
 
-        print(f"\n📊 Cost Breakdown for {comparison['cheapest']}:\n")
+        print(f"\n📊 Cost Breakdown for {cheapest['provider']}:\n")
         breakdown = cheapest['breakdown']
         print(f"  Storage:        ${breakdown['storage_cost']:>10.2f}")
         print(f"  Transfer:       ${breakdown['transfer_cost']:>10.2f}")
@@ -106,15 +109,11 @@ def compare_cloud_costs(api_url: str, disk_size_gb: float, duration_days: int,
 
                 # Show quarterly breakdown
                 print(f"Quarterly Breakdown:")
-                quarters = {
-                    'Q1': sum(m['total_cost'] for m in projection['monthly_breakdown'][0:3]),
-                    'Q2': sum(m['total_cost'] for m in projection['monthly_breakdown'][3:6]),
-                    'Q3': sum(m['total_cost'] for m in projection['monthly_breakdown'][6:9]),
-                    'Q4': sum(m['total_cost'] for m in projection['monthly_breakdown'][9:12]),
-                }
+                months = [m['total_cost'] for m in projection['monthly_breakdown']]
+                quarters = [sum(months[i:i + 3]) for i in range(0, len(months), 3)]
 
-                for quarter, cost in quarters.items():
-                    print(f"  {quarter}: ${cost:>10.2f}")
+                for quarter, cost in enumerate(quarters, 1):
+                    print(f"  Q{quarter}: ${cost:>10.2f}")
 
             except Exception as e:
                 print(f"⚠️  Could not project yearly costs: {e}")
@@ -170,13 +169,17 @@ def main():
 
     args = parser.parse_args()
 
-    return compare_cloud_costs(
-        args.api_url,
-        args.disk_size,
-        args.duration,
-        args.format,
-        args.snapshots
-    )
+    # Imported after argument parsing so --help and usage errors stay fast
+    from hypersdk import HyperSDK
+
+    with HyperSDK(args.api_url) as client:
+        return compare_cloud_costs(
+            client,
+            args.disk_size,
+            args.duration,
+            args.format,
+            args.snapshots
+        )
 
 
 if __name__ == '__main__':
@@ -13,13 +13,15 @@ import argparse
 import sys
 import time
 from datetime import datetime
-from hypersdk import HyperSDK
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from hypersdk import HyperSDK
 
-def setup_and_run_incremental_backup(api_url: str, vm_path: str, output_path: str):
-    """Set up CBT and perform incremental backup"""
 
-    client = HyperSDK(api_url)
+def setup_and_run_incremental_backup(client: "HyperSDK", vm_path: str, output_path: str):
+    """Set up CBT and perform incremental backup"""
+    from hypersdk import JobStatus
 
     print(f"🔧 Setting up incremental backup for {vm_path}\n")
 
@@ -85,57 +87,44 @@ def setup_and_run_incremental_backup(api_url: str, vm_path: str, output_path: st
         print(f"❌ Failed to submit backup job: {e}")
         return 1
 
-    # Step 4: Monitor backup progress
+    # Step 4: Monitor backup progress; watch_job reports state changes only
     start_time = time.time()
-    last_percent = -1
-
-    while True:
-        try:
-            job = client.get_job(job_id)
-            status = job['status']
-
-            if status == 'completed':
-                duration = time.time() - start_time
-                result = job.get('result', {})
-
-                print(f"\n✅ Incremental backup completed!")
-                print(f"   Output: {output_dir}")
-                print(f"   Duration: {duration:.1f} seconds")
-                print(f"   Size: {result.get('total_size_bytes', 0) / 1e9:.2f} GB")
-
-                # Show savings if available
-                if analysis.get('estimated_savings_bytes'):
-                    original_size = result.get('total_size_bytes', 0)
-                    saved = (1 - original_size / analysis['estimated_savings_bytes']) * 100
-                    print(f"   Storage saved: {saved:.1f}%")
 
-                return 0
+    try:
+        for job in client.watch_job(job_id):
+            if job.status == JobStatus.RUNNING and job.progress:
+                progress = job.progress
+                phase = progress.phase or 'backing up'
+                eta = progress.estimated_remaining or 'N/A'
+                print(f"⏳ {phase}: {progress.percent_complete:.1f}% (ETA: {eta})")
 
-            elif status == 'failed':
-                error = job.get('error', 'Unknown error')
-                print(f"\n❌ Backup failed: {error}")
-                return 1
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        return 130
 
-            elif status == 'running':
-                progress = job.get('progress', {})
-                percent = progress.get('percent_complete', 0)
+    except Exception as e:
+        print(f"⚠️  Error: {e}")
+        return 1
 
-                if percent != last_percent:
-                    phase = progress.get('phase', 'backing up')
-                    speed = progress.get('speed_mbps', 0)
-                    eta = progress.get('eta_seconds', 0)
+    if job.status == JobStatus.COMPLETED:
+        duration = time.time() - start_time
+        total_size = job.result.total_size if job.result else 0
 
-                    print(f"⏳ {phase}: {percent:.1f}% ({speed:.1f} MB/s, ETA: {eta:.0f}s)")
-                    last_percent = percent
+        print(f"\n✅ Incremental backup completed!")
+        print(f"   Output: {output_dir}")
+        print(f"   Duration: {duration:.1f} seconds")
+        print(f"   Size: {total_size / 1e9:.2f} GB")
 
-        except KeyboardInterrupt:
-            print("\n⚠️  Interrupted by user")
-            return 130
+        # Show savings if available
+        if analysis.get('estimated_savings_bytes'):
+            saved = (1 - total_size / analysis['estimated_savings_bytes']) * 100
+            print(f"   Storage saved: {saved:.1f}%")
 
-        except Exception as e:
-            print(f"⚠️  Error: {e}")
+        return 0
 
-        time.sleep(3)
+    error = job.error or 'Unknown error'
+    print(f"\n❌ Backup {job.status.value}: {error}")
+    return 1
 
 
 def main():
@@ -151,7 +140,11 @@ def main():
 
     args = parser.parse_args()
 
-    return setup_and_run_incremental_backup(args.api_url, args.vm, args.output)
+    # Imported after argument parsing so --help and usage errors stay fast
+    from hypersdk import HyperSDK
+
+    with HyperSDK(args.api_url) as client:
+        return setup_and_run_incremental_backup(client, args.vm, args.output)
 
 
 if __name__ == '__main__':
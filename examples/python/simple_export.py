@@ -9,16 +9,16 @@ Usage:
 """
 
 import argparse
-import time
 import sys
-from hypersdk import HyperSDK
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from hypersdk import HyperSDK
 
-def export_vm(api_url: str, vm_path: str, output_path: str, format: str = "ova"):
-    """Export a VM and monitor progress"""
 
-    # Initialize client
-    client = HyperSDK(api_url)
+def export_vm(client: "HyperSDK", vm_path: str, output_path: str, format: str = "ova"):
+    """Export a VM and monitor progress"""
+    from hypersdk import JobStatus
 
     print(f"🚀 Starting export of {vm_path}")
     print(f"   Output: {output_path}")
@@ -38,45 +38,38 @@ def export_vm(api_url: str, vm_path: str, output_path: str, format: str = "ova")
         print(f"❌ Failed to submit job: {e}")
         return 1
 
-    # Monitor progress
+    # Monitor progress on one in-place line; a new line starts per phase
+    progress_line = "\r⏳ {}: {:5.1f}% complete"
     last_phase = None
-    while True:
-        try:
-            job = client.get_job(job_id)
-            status = job['status']
-
-            if status == 'completed':
-                result = job.get('result', {})
-                print(f"\n✅ Export completed!")
-                print(f"   OVF Path: {result.get('ovf_path', 'N/A')}")
-                print(f"   Total Time: {job.get('duration', 'N/A')}")
-                return 0
-
-            elif status == 'failed':
-                error = job.get('error', 'Unknown error')
-                print(f"\n❌ Export failed: {error}")
-                return 1
-
-            elif status == 'running':
-                progress = job.get('progress', {})
-                phase = progress.get('phase', 'unknown')
-                percent = progress.get('percent_complete', 0)
-                speed = progress.get('speed_mbps', 0)
-
-                # Only print if phase changed or every 5% progress
-                if phase != last_phase or percent % 5 == 0:
-                    print(f"⏳ {phase}: {percent:.1f}% complete ({speed:.1f} MB/s)")
-                    last_phase = phase
+    try:
+        for job in client.watch_job(job_id):
+            if job.status == JobStatus.RUNNING and job.progress:
+                progress = job.progress
+                if last_phase is not None and progress.phase != last_phase:
+                    sys.stdout.write("\n")
+                sys.stdout.write(progress_line.format(progress.phase, progress.percent_complete))
+                sys.stdout.flush()
+                last_phase = progress.phase
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        print(f"   Job {job_id} is still running on the server")
+        return 130
 
-        except KeyboardInterrupt:
-            print("\n⚠️  Interrupted by user")
-            print(f"   Job {job_id} is still running on the server")
-            return 130
+    except Exception as e:
+        print(f"\n⚠️  Error checking status: {e}")
+        return 1
 
-        except Exception as e:
-            print(f"⚠️  Error checking status: {e}")
+    if job.status == JobStatus.COMPLETED:
+        print(f"\n✅ Export completed!")
+        if job.result:
+            print(f"   OVF Path: {job.result.ovf_path}")
+            print(f"   Total Time: {job.result.duration / 1e9:.1f}s")
+        return 0
 
-        time.sleep(5)
+    error = job.error or 'Unknown error'
+    print(f"\n❌ Export {job.status.value}: {error}")
+    return 1
 
 
 def main():
@@ -92,7 +85,11 @@ def main():
 
     args = parser.parse_args()
 
-    return export_vm(args.api_url, args.vm, args.output, args.format)
+    # Imported after argument parsing so --help and usage errors stay fast
+    from hypersdk import HyperSDK
+
+    with HyperSDK(args.api_url) as client:
+        return export_vm(client, args.vm, args.output, args.format)
 
 
 if __name__ == '__main__':
@@ -14,7 +14,7 @@ Features:
 """
 
 from datetime import datetime, timedelta
-from hypersdk import HyperSDK, JobDefinition
+from hypersdk import HyperSDK, HyperSDKError, JobDefinition
 
 # Configuration
 DAEMON_URL = "http://localhost:8080"
@@ -22,11 +22,8 @@ CARBON_ZONE = "US-CAL-CISO"  # California grid
 THRESHOLD = 200.0  # gCO2/kWh - good/moderate boundary
 
 
-def main():
+def main(client):
     """Main example workflow."""
-    # Initialize client
-    client = HyperSDK(DAEMON_URL)
-
     print("🌿 Carbon-Aware Backup Example")
     print("=" * 60)
     print()
@@ -243,28 +240,30 @@ def print_best_practices():
         print(f"  {i}. {practice}")
 
 
-def print_zone_comparison():
+def print_zone_comparison(client):
     """Compare carbon intensity across zones."""
     print("Zone Comparison Example:")
     print()
 
-    client = HyperSDK(DAEMON_URL)
     zones_to_check = ["US-CAL-CISO", "DE", "SE"]
 
     print(f"{'Zone':<15} {'Intensity':<15} {'Quality':<12} {'Renewable':<12}")
     print("-" * 60)
 
-    for zone_id in zones_to_check:
-        try:
-            status = client.get_carbon_status(zone=zone_id)
-            print(f"{zone_id:<15} {status.current_intensity:>8.1f} gCO2/kWh   {status.quality:<12} {status.renewable_percent:>6.1f}%")
-        except Exception as e:
-            print(f"{zone_id:<15} Error: {e}")
+    # A zone that fails is reported on its own row; the others still print
+    statuses = client.get_carbon_status_batch(zones_to_check)
+    for zone_id, status in statuses.items():
+        if isinstance(status, HyperSDKError):
+            print(f"{zone_id:<15} Error: {status}")
+            continue
+        print(f"{zone_id:<15} {status.current_intensity:>8.1f} gCO2/kWh   {status.quality:<12} {status.renewable_percent:>6.1f}%")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        # One client (and connection pool) is shared by every example
+        with HyperSDK(DAEMON_URL, cache_dir="~/.cache/hypersdk") as client:
+            main(client)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
     except Exception as e:
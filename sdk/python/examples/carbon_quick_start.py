@@ -18,16 +18,7 @@ print(f"Grid Status: {status.quality.upper()}")
 print(f"Carbon Intensity: {status.current_intensity:.0f} gCO2/kWh")
 print(f"Optimal for Backup: {'✓ Yes' if status.optimal_for_backup else '✗ No'}\n")
 
-# 2. Estimate savings
-estimate = client.estimate_carbon_savings(
-    zone="US-CAL-CISO",
-    data_size_gb=500,
-    duration_hours=2
-)
-print(f"Potential Savings: {estimate.savings_percent:.1f}%")
-print(f"Recommendation: {estimate.recommendation}\n")
-
-# 3. Submit carbon-aware backup
+# 2. Submit carbon-aware backup
 job_def = JobDefinition(
     vm_path="/datacenter/vm/prod-db",
     output_dir="/backups"
@@ -37,6 +28,15 @@ if status.optimal_for_backup:
     print("✅ Submitting backup now (grid is clean)")
     job_id = client.submit_carbon_aware_job(job_def, max_intensity=200)
 else:
+    # Savings only matter when the job would be delayed
+    estimate = client.estimate_carbon_savings(
+        zone="US-CAL-CISO",
+        data_size_gb=500,
+        duration_hours=2
+    )
+    print(f"Potential Savings: {estimate.savings_percent:.1f}%")
+    print(f"Recommendation: {estimate.recommendation}\n")
+
     print("⏰ Grid is dirty - job will be delayed for cleaner period")
     job_id = client.submit_carbon_aware_job(job_def, max_intensity=200, max_delay_hours=4)
 
@@ -1,63 +1,77 @@
 #!/usr/bin/env python3
 """Example: Monitor job progress in real-time."""
 
+import shutil
+import signal
 import sys
-import time
+import threading
 from hypersdk import HyperSDK, JobStatus
 
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Progress bars are sliced from these instead of rebuilt per job per refresh
+_BAR_FULL = '█' * 40
+_BAR_EMPTY = '░' * 40
+
+
 def format_bytes(bytes_val):
     """Format bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.2f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.2f} PB"
+    bytes_val = int(bytes_val)
+    # Each unit is 2**10 larger, so the bit length picks it directly
+    idx = min(5, (bytes_val.bit_length() - 1) // 10) if bytes_val > 0 else 0
+    return f"{bytes_val / (1 << (idx * 10)):.2f} {_BYTE_UNITS[idx]}"
 
 
-def monitor_job(client, job_id):
-    """Monitor a single job until completion."""
-    print(f"Monitoring job: {job_id}\n")
+def monitor_job(client, job_id, stop, poll_min=2.0, poll_max=10.0):
+    """Monitor a single job until completion, or cancel it once ``stop`` is set.
 
-    while True:
-        try:
-            job = client.get_job(job_id)
+    Polls every ``poll_min`` seconds after a status or phase change and
+    doubles the interval, up to ``poll_max``, while the job is idle.
+    """
+    print(f"Monitoring job: {job_id}\n")
 
-            # Clear line and print status
-            print(f"\r\033[K", end="")  # Clear current line
-            print(f"Status: {job.status.value}", end="")
+    try:
+        # watch_job only yields when the status or progress changed, so the
+        # line is redrawn on updates rather than on every poll. Only the
+        # latest state is shown, so one Job can be refreshed in place.
+        for job in client.watch_job(
+            job_id, poll_interval=poll_min, max_interval=poll_max, backoff=2.0,
+            stop=stop, reuse=True,
+        ):
+            # Build the whole status line, then clear and rewrite it at once
+            parts = ["\r\033[K", f"Status: {job.status.value}"]
 
             if job.progress:
                 progress = job.progress
-                print(f" | Progress: {progress.percent_complete:.1f}%", end="")
-                print(f" | Phase: {progress.phase}", end="")
+                parts.append(f" | Progress: {progress.percent_complete:.1f}%")
+                parts.append(f" | Phase: {progress.phase}")
 
                 if progress.current_file:
-                    print(f" | File: {progress.current_file}", end="")
+                    parts.append(f" | File: {progress.current_file}")
 
                 if progress.bytes_downloaded and progress.total_bytes:
                     downloaded = format_bytes(progress.bytes_downloaded)
                     total = format_bytes(progress.total_bytes)
-                    print(f" | {downloaded}/{total}", end="")
+                    parts.append(f" | {downloaded}/{total}")
 
                 if progress.estimated_remaining:
-                    print(f" | ETA: {progress.estimated_remaining}", end="")
+                    parts.append(f" | ETA: {progress.estimated_remaining}")
 
-            # Check if job is complete
-            if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                print()  # New line
-                break
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
 
-            time.sleep(2)  # Poll every 2 seconds
+        print()  # New line
 
-        except KeyboardInterrupt:
-            print("\n\nCancelling job...")
-            client.cancel_job(job_id)
-            print("Job cancelled.")
-            return 1
-        except Exception as e:
-            print(f"\nError: {e}")
-            return 1
+    except Exception as e:
+        print(f"\nError: {e}")
+        return 1
+
+    if stop.is_set():
+        print("\nCancelling job...")
+        client.cancel_job(job_id)
+        print("Job cancelled.")
+        return 1
 
     # Print final result
     print(f"\n{'='*80}")
@@ -83,58 +97,84 @@ def monitor_job(client, job_id):
     return 0
 
 
-def monitor_all_jobs(client):
-    """Monitor all running jobs."""
+def render_frame(prev_lines, new_lines):
+    """Redraw only the screen lines that differ from the previous frame."""
+    buf = []
+    for i, line in enumerate(new_lines):
+        if i >= len(prev_lines) or prev_lines[i] != line:
+            buf.append(f"\033[{i + 1};1H\033[K{line}")
+    # Blank out rows left over from a taller previous frame
+    for i in range(len(new_lines), len(prev_lines)):
+        buf.append(f"\033[{i + 1};1H\033[K")
+    buf.append(f"\033[{len(new_lines) + 1};1H")
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
+
+
+def monitor_all_jobs(client, stop):
+    """Monitor all running jobs until none are left or ``stop`` is set."""
     print("Monitoring all jobs...\n")
 
-    while True:
-        try:
-            # Get all jobs
-            jobs = client.list_jobs(all=True)
+    last_state = None
+    prev_lines = None
 
-            # Filter running jobs
-            running_jobs = [j for j in jobs if j.status == JobStatus.RUNNING]
+    while not stop.is_set():
+        try:
+            # Let the daemon filter to running jobs instead of fetching all
+            running_jobs = client.query_jobs(status=[JobStatus.RUNNING])
 
             if not running_jobs:
                 print("No running jobs.")
                 break
 
-            # Clear screen
-            print("\033[2J\033[H", end="")
+            # Only redraw when a job started, finished or made progress
+            state = {j.definition.id: j.progress for j in running_jobs}
+            if state == last_state:
+                stop.wait(3)
+                continue
+            last_state = state
 
-            # Print header
-            print(f"{'='*80}")
-            print(f"Running Jobs: {len(running_jobs)}")
-            print(f"{'='*80}\n")
+            # Keep lines within the terminal so they never wrap
+            width = shutil.get_terminal_size().columns
+            bar_length = max(10, min(40, width - 12))
+            rule = '=' * min(80, width)
+
+            lines = [rule, f"Running Jobs: {len(running_jobs)}", rule, ""]
 
-            # Print each job
             for job in running_jobs:
                 job_id = job.definition.id or "Unknown"
                 name = job.definition.name or job.definition.vm_path
-                print(f"Job: {job_id} - {name}")
+                lines.append(f"Job: {job_id} - {name}"[:width])
 
                 if job.progress:
                     progress = job.progress
-                    bar_length = 40
-                    filled = int(bar_length * progress.percent_complete / 100)
-                    bar = '█' * filled + '░' * (bar_length - filled)
-                    print(f"  [{bar}] {progress.percent_complete:.1f}%")
-                    print(f"  Phase: {progress.phase}")
+                    filled = min(bar_length, int(bar_length * progress.percent_complete / 100))
+                    bar = _BAR_FULL[:filled] + _BAR_EMPTY[:bar_length - filled]
+                    lines.append(f"  [{bar}] {progress.percent_complete:.1f}%")
+                    lines.append(f"  Phase: {progress.phase}"[:width])
 
                     if progress.estimated_remaining:
-                        print(f"  ETA: {progress.estimated_remaining}")
+                        lines.append(f"  ETA: {progress.estimated_remaining}"[:width])
+
+                lines.append("")
 
-                print()
+            # Clear the screen once, then rewrite only the lines that changed
+            if prev_lines is None:
+                sys.stdout.write("\033[2J")
+                prev_lines = []
+            render_frame(prev_lines, lines)
+            prev_lines = lines
 
-            time.sleep(3)  # Refresh every 3 seconds
+            stop.wait(3)  # Refresh every 3 seconds
 
-        except KeyboardInterrupt:
-            print("\nStopped monitoring.")
-            return 0
         except Exception as e:
             print(f"\nError: {e}")
             return 1
 
+    if stop.is_set():
+        print("\nStopped monitoring.")
+    return 0
+
 
 def main():
     if len(sys.argv) > 1:
@@ -144,6 +184,11 @@ def main():
         job_id = None
         mode = "all"
 
+    # Ctrl-C only sets a flag; the loops notice it between requests, so a
+    # request is never interrupted half way through.
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+
     # Initialize client
     client = HyperSDK("http://localhost:8080")
 
@@ -152,9 +197,9 @@ def main():
         # client.login("admin", "password")
 
         if mode == "single":
-            return monitor_job(client, job_id)
+            return monitor_job(client, job_id, stop)
         else:
-            return monitor_all_jobs(client)
+            return monitor_all_jobs(client, stop)
 
     finally:
         client.close()
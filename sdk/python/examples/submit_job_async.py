@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Example: Submit a VM export job with the asyncio client (AsyncHyperSDK)."""
+
+import asyncio
+
+from hypersdk import AsyncHyperSDK, JobDefinition, VCenterConfig, ExportFormat
+
+async def main():
+    # Initialize client
+    client = AsyncHyperSDK("http://localhost:8080")
+
+    try:
+        # Login (if authentication is enabled)
+        # await client.login("admin", "password")
+
+        # Check daemon health and status concurrently
+        health, status = await asyncio.gather(client.health(), client.status())
+        print(f"✓ Daemon is {health['status']}")
+        print(f"✓ Version: {status.version}")
+        print(f"✓ Uptime: {status.uptime}")
+        print(f"✓ Total jobs: {status.total_jobs}")
+        print(f"✓ Running jobs: {status.running_jobs}")
+
+        # Define vCenter connection
+        vcenter = VCenterConfig(
+            server="vcenter.example.com",
+            username="administrator@vsphere.local",
+            password="your-password",
+            insecure=True  # Skip TLS verification for development
+        )
+
+        # Create job definition
+        job_def = JobDefinition(
+            name="Export Ubuntu Server",
+            vm_path="/Datacenter/vm/ubuntu-server",
+            output_dir="/exports",
+            vcenter=vcenter,
+            format=ExportFormat.OVF,
+            compress=True,
+            thin=True
+        )
+
+        # Submit job
+        print("\nSubmitting job...")
+        job_id = await client.submit_job(job_def)
+        print(f"✓ Job submitted successfully!")
+        print(f"  Job ID: {job_id}")
+
+        # Get job details
+        job = await client.get_job(job_id)
+        print(f"  Status: {job.status.value}")
+
+        if job.progress:
+            print(f"  Progress: {job.progress.percent_complete}%")
+            print(f"  Phase: {job.progress.phase}")
+
+        print(f"\nMonitor job progress with:")
+        print(f"  python examples/monitor_jobs.py {job_id}")
+
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return 1
+    finally:
+        await client.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(asyncio.run(main()))
@@ -2,52 +2,86 @@
 HyperSDK Python Client
 
 VM migration and export platform client library.
+
+Public names are loaded on first access, so importing a model such as
+``JobStatus`` does not pull in the HTTP client and its dependencies.
 """
 
-from .client import HyperSDK, AsyncHyperSDK
-from .models import (
-    JobDefinition,
-    JobStatus,
-    Job,
-    JobProgress,
-    JobResult,
-    VCenterConfig,
-    ExportOptions,
-    ScheduledJob,
-    Webhook,
-    CarbonStatus,
-    CarbonForecast,
-    CarbonReport,
-    CarbonZone,
-    CarbonEstimate,
-)
-from .exceptions import (
-    HyperSDKError,
-    AuthenticationError,
-    JobNotFoundError,
-    APIError,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import HyperSDK, AsyncHyperSDK
+    from .models import (
+        JobDefinition,
+        JobStatus,
+        Job,
+        JobProgress,
+        JobResult,
+        VCenterConfig,
+        ExportOptions,
+        ExportFormat,
+        ExportMethod,
+        ScheduledJob,
+        Webhook,
+        DaemonStatus,
+        CarbonStatus,
+        CarbonForecast,
+        CarbonReport,
+        CarbonZone,
+        CarbonEstimate,
+    )
+    from .exceptions import (
+        HyperSDKError,
+        AuthenticationError,
+        JobNotFoundError,
+        APIError,
+        ValidationError,
+        WebSocketError,
+    )
 
 __version__ = "2.0.0"
-__all__ = [
-    "HyperSDK",
-    "AsyncHyperSDK",
-    "JobDefinition",
-    "JobStatus",
-    "Job",
-    "JobProgress",
-    "JobResult",
-    "VCenterConfig",
-    "ExportOptions",
-    "ScheduledJob",
-    "Webhook",
-    "CarbonStatus",
-    "CarbonForecast",
-    "CarbonReport",
-    "CarbonZone",
-    "CarbonEstimate",
-    "HyperSDKError",
-    "AuthenticationError",
-    "JobNotFoundError",
-    "APIError",
-]
+
+_LAZY = {
+    "HyperSDK": ".client",
+    "AsyncHyperSDK": ".client",
+    "JobDefinition": ".models",
+    "JobStatus": ".models",
+    "Job": ".models",
+    "JobProgress": ".models",
+    "JobResult": ".models",
+    "VCenterConfig": ".models",
+    "ExportOptions": ".models",
+    "ExportFormat": ".models",
+    "ExportMethod": ".models",
+    "ScheduledJob": ".models",
+    "Webhook": ".models",
+    "DaemonStatus": ".models",
+    "CarbonStatus": ".models",
+    "CarbonForecast": ".models",
+    "CarbonReport": ".models",
+    "CarbonZone": ".models",
+    "CarbonEstimate": ".models",
+    "HyperSDKError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "JobNotFoundError": ".exceptions",
+    "APIError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "WebSocketError": ".exceptions",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,46 @@
+"""In-memory response caching for the HyperSDK client."""
+
+import copy
+import functools
+import time
+from typing import Any, Callable
+
+
+def ttl_cache(seconds: float, maxsize: int = 128) -> Callable:
+    """Cache a client method's return value for a fixed time.
+
+    Entries are stored on the client instance in ``self._ttl_cache`` so they
+    share the client's lifetime and can be dropped with
+    ``HyperSDK.invalidate_cache()``. Method arguments must be hashable.
+
+    Each call returns a copy of the cached value, so callers may modify the
+    result without affecting later calls.
+
+    Args:
+        seconds: Time to live for each cached entry
+        maxsize: Maximum number of entries kept in ``self._ttl_cache``; when
+            it is full, expired entries are dropped first, then the oldest
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            key = (func.__name__, args, frozenset(kwargs.items()))
+            cache = self._ttl_cache
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return copy.deepcopy(entry[1])
+            value = func(self, *args, **kwargs)
+            cache.pop(key, None)
+            if len(cache) >= maxsize:
+                for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                    del cache[stale]
+                while len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+            cache[key] = (now + seconds, value)
+            return copy.deepcopy(value)
+
+        return wrapper
+
+    return decorator
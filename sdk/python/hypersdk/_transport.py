@@ -0,0 +1,108 @@
+"""Alternative HTTP transports for the HyperSDK client."""
+
+from typing import Any, Iterator
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Errors either transport can raise while a streamed body is being read
+if httpx is not None:
+    TRANSPORT_ERRORS = (requests.RequestException, httpx.HTTPError)
+else:  # pragma: no cover - optional dependency
+    TRANSPORT_ERRORS = (requests.RequestException,)
+
+
+class HTTPXSession:
+    """HTTP/2 session backed by ``httpx.Client``.
+
+    Exposes the subset of the ``requests.Session`` interface that
+    ``HyperSDK`` uses, so the client code stays the same for both transports.
+    Concurrent requests from several threads are multiplexed over a single
+    connection per host instead of each holding a pooled HTTP/1.1 connection.
+    """
+
+    def __init__(self, pool_maxsize: int, max_retries: int, verify: bool):
+        """Initialize the session.
+
+        Args:
+            pool_maxsize: Maximum number of connections to the daemon
+            max_retries: Retries for failed connection attempts
+            verify: Whether to verify SSL certificates
+
+        Raises:
+            ImportError: If httpx (with HTTP/2 support) is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                'The httpx transport requires httpx: pip install "hypersdk[http2]"'
+            )
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=verify,
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize,
+                ),
+            ),
+        )
+        self.headers = self.client.headers
+
+    def request(self, method: str, url: str, verify: Any = None, **kwargs: Any) -> Any:
+        """Send a request, raising ``requests`` exceptions on failure.
+
+        ``verify`` is accepted for signature compatibility; certificate
+        verification is fixed when the session is created. With
+        ``stream=True`` the body is left unread so it can be consumed with
+        ``iter_bytes`` (or ``read_prefix`` for an error body).
+        """
+        stream = kwargs.pop("stream", False)
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        try:
+            if not stream:
+                return self.client.request(method, url, **kwargs)
+            request = self.client.build_request(method, url, **kwargs)
+            return self.client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all connections."""
+        self.client.close()
+
+
+def read_body(response: Any) -> bytes:
+    """Read the full body of a response from either transport, even if streamed."""
+    if isinstance(response, requests.Response):
+        return response.content
+    return response.read()
+
+
+def iter_bytes(response: Any, chunk_size: int) -> Iterator[bytes]:
+    """Iterate over a response body from either transport in chunks."""
+    if isinstance(response, requests.Response):
+        return response.iter_content(chunk_size)
+    return response.iter_bytes(chunk_size)
+
+
+def read_prefix(response: Any, limit: int) -> bytes:
+    """Read at most ``limit`` bytes of a streamed body from either transport.
+
+    The rest of the body is left unread; close the response afterwards.
+    """
+    buf = bytearray()
+    for chunk in iter_bytes(response, min(limit, 16384)):
+        buf += chunk
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit])
@@ -1,9 +1,27 @@
 """HyperSDK synchronous and asynchronous clients."""
 
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import random
+import threading
+import time
 import requests
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from typing import (
+    AsyncIterator, BinaryIO, Callable, Iterator, List, Optional, Dict, Any, Tuple, Union
+)
+from urllib3.util.retry import Retry
 
+from . import __version__
+from ._cache import ttl_cache
+from ._transport import TRANSPORT_ERRORS, HTTPXSession, iter_bytes, read_body, read_prefix
 from .models import (
     Job,
     JobDefinition,
@@ -25,6 +43,182 @@ from .exceptions import (
     APIError,
 )
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import ijson
+
+    _IJSON_ERRORS: Tuple[type, ...] = (ijson.JSONError,)
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+    _IJSON_ERRORS = ()
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Request bodies are encoded up front rather than through requests' json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# At most this much of an error body (e.g. an HTML page from a proxy) is
+# read from a streamed response or parsed from a buffered one
+_MAX_ERROR_BODY = 65536
+
+# Carbon intensity data refreshes at ~5 minute granularity.
+_CARBON_STATUS_TTL = 60
+
+_TERMINAL_STATUSES = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
+# Wire values for the status filters seen so far, keyed by the filter tuple
+_STATUS_VALUES: Dict[Tuple[JobStatus, ...], List[str]] = {}
+
+
+def _status_values(status: List[JobStatus]) -> List[str]:
+    """Return the wire values for a status filter, reusing earlier results."""
+    key = tuple(status)
+    values = _STATUS_VALUES.get(key)
+    if values is None:
+        values = _STATUS_VALUES[key] = [s.value for s in key]
+    return values
+
+
+def _carbon_metadata(
+    carbon_zone: str, max_intensity: float, max_delay_hours: float
+) -> Dict[str, Any]:
+    """Build the job metadata that makes the daemon schedule by grid carbon."""
+    return {
+        "carbon_aware": True,
+        "carbon_zone": carbon_zone,
+        "carbon_max_intensity": max_intensity,
+        # Nanoseconds, rounded rather than truncated so e.g. 2.3h is exact
+        "carbon_max_delay": round(max_delay_hours * 3_600_000_000_000),
+    }
+
+
+def _submitted_job_id(response: Dict[str, Any]) -> str:
+    """Return the job ID from a single-job submit response.
+
+    Raises:
+        APIError: If the daemon rejected the job
+    """
+    if response["accepted"] == 0:
+        errors = response.get("errors", ["Unknown error"])
+        raise APIError(f"Job submission failed: {errors[0]}")
+    return response["job_ids"][0]
+
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    """Split ``items`` into consecutive lists of at most ``size`` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _query_body(
+    job_ids: Optional[List[str]],
+    status: Optional[List[JobStatus]],
+    all: bool,
+    limit: Optional[int],
+) -> Dict[str, Any]:
+    """Build the ``/jobs/query`` request body, omitting unset filters."""
+    request_data: Dict[str, Any] = {}
+    if job_ids:
+        request_data["job_ids"] = job_ids
+    if status:
+        request_data["status"] = _status_values(status)
+    if all:
+        request_data["all"] = True
+    if limit:
+        request_data["limit"] = limit
+    return request_data
+
+
+def _jobs(response: Dict[str, Any]) -> List[Job]:
+    """Parse the job list of a query response (``null`` when empty)."""
+    return [Job.from_dict(data) for data in response.get("jobs") or []]
+
+
+def _cancelled(job_id: str, response: Dict[str, Any]) -> bool:
+    """Return whether a cancel response reports ``job_id`` as cancelled.
+
+    The daemon encodes empty lists and maps as ``null``.
+
+    Raises:
+        APIError: If the daemon failed to cancel the job
+    """
+    if job_id in (response.get("cancelled") or ()):
+        return True
+    if job_id in (response.get("failed") or ()):
+        error = (response.get("errors") or {}).get(job_id, "Unknown error")
+        raise APIError(f"Failed to cancel job: {error}")
+    return False
+
+
+def _api_error(status_code: int, body: bytes) -> APIError:
+    """Build the ``APIError`` for an error response body."""
+    error_msg = body[:1024].decode("utf-8", "replace")
+    try:
+        error_data = _loads(body) if body else None
+    except ValueError:
+        error_data = None
+    if isinstance(error_data, dict):
+        error_msg = error_data.get("error", error_msg)
+    return APIError(
+        f"API error: {error_msg}", status_code=status_code, response=error_data
+    )
+
+
+class _WatchPolicy:
+    """Poll schedule shared by the ``watch_job`` implementations.
+
+    The interval grows by ``backoff`` while the job is unchanged (up to
+    ``max_interval``), holds while only the percentage moves, and drops
+    back to ``poll_interval`` when the status or phase changes.
+    """
+
+    __slots__ = (
+        "poll_interval", "max_interval", "backoff", "interval", "_phase", "_snapshot"
+    )
+
+    def __init__(self, poll_interval: float, max_interval: float, backoff: float):
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = poll_interval
+        self._phase: Any = None
+        self._snapshot: Any = None
+
+    def observe(self, job: Job) -> bool:
+        """Record a polled job and return whether it changed since the last poll."""
+        phase = (job.status, job.progress.phase if job.progress else None)
+        snapshot = (job.status, job.progress)
+        if phase != self._phase:
+            self.interval = self.poll_interval
+        elif snapshot == self._snapshot:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        self._phase = phase
+        if snapshot == self._snapshot:
+            return False
+        # Copy the progress so a job refreshed in place still compares
+        # against the previous values
+        self._snapshot = (job.status, copy.copy(job.progress))
+        return True
+
+    def delay(self) -> float:
+        """Return the wait before the next poll, with +/-20% jitter."""
+        return self.interval * random.uniform(0.8, 1.2)
+
 
 class HyperSDK:
     """Synchronous HyperSDK client.
@@ -46,63 +240,154 @@ class HyperSDK:
         api_key: Optional[str] = None,
         timeout: int = 30,
         verify_ssl: bool = True,
+        pool_maxsize: int = 16,
+        max_retries: int = 3,
+        cache_dir: Optional[str] = None,
+        transport: str = "requests",
+        token_refresh_callback: Optional[Callable[[], str]] = None,
     ):
         """Initialize the HyperSDK client.
 
+        All calls share one keep-alive connection pool, so reuse a single
+        client instead of creating one per operation.
+
         Args:
             base_url: Base URL of the HyperSDK API (e.g., "http://localhost:8080")
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of pooled connections to the daemon
+            max_retries: Retries for connection errors and 429/502/503/504
+                responses on idempotent requests, honouring Retry-After.
+                POSTs (job submission, cancellation) are never retried so
+                they cannot be applied twice
+            cache_dir: Optional directory for persisting ETag-validated
+                responses across client instances (e.g. "~/.cache/hypersdk")
+            transport: "requests" (HTTP/1.1, default) or "httpx" to multiplex
+                calls over one HTTP/2 connection; "httpx" needs the ``http2``
+                extra and only retries failed connection attempts
+            token_refresh_callback: Optional callable returning a fresh
+                bearer token, used instead of the ``login()`` credentials
+                to re-authenticate when the daemon answers 401
+
+        Raises:
+            ValueError: If ``transport`` is unknown
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        if transport == "httpx":
+            self.session = HTTPXSession(pool_maxsize, max_retries, verify_ssl)
+        elif transport == "requests":
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_maxsize,
+                pool_maxsize=pool_maxsize,
+                max_retries=Retry(
+                    total=max_retries,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 502, 503, 504),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        else:
+            raise ValueError(f"Unknown transport: {transport!r}")
         self._token: Optional[str] = None
-
+        self._creds: Optional[Tuple[str, str]] = None
+        self._token_refresh_callback = token_refresh_callback
+        self._token_lock = threading.Lock()
+        self._ttl_cache: Dict[Any, Any] = {}
+        self._carbon_statuses: Dict[str, Any] = {}
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+        self.session.headers["User-Agent"] = f"hypersdk-python/{__version__}"
         if api_key:
             self.session.headers["X-API-Key"] = api_key
 
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses so the next calls hit the API."""
+        self._ttl_cache.clear()
+        self._carbon_statuses.clear()
+
     def _url(self, path: str) -> str:
-        """Construct full URL from path."""
-        return urljoin(self.base_url, path)
+        """Construct full URL from an absolute API path."""
+        return self.base_url + path
 
-    def _request(
+    def _set_token(self, token: Optional[str]) -> None:
+        """Install ``token`` as the bearer token for all subsequent calls."""
+        self._token = token
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def _refresh_token(self, stale_token: Optional[str]) -> bool:
+        """Obtain a new token after a 401 response.
+
+        Concurrent callers that hit a 401 with the same expired token share
+        a single refresh; the others wait on the lock and reuse its result.
+
+        Args:
+            stale_token: Token that was sent with the rejected request
+
+        Returns:
+            True if the request should be replayed with the current token
+        """
+        if self._token_refresh_callback is None and self._creds is None:
+            return False
+        with self._token_lock:
+            if self._token == stale_token:
+                if self._token_refresh_callback is not None:
+                    self._set_token(self._token_refresh_callback())
+                else:
+                    self.login(*self._creds)
+        return True
+
+    def _send(
         self,
         method: str,
         path: str,
         json: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        _is_retry: bool = False,
         **kwargs,
-    ) -> Any:
-        """Make HTTP request to the API.
+    ) -> requests.Response:
+        """Send an HTTP request and map error responses to exceptions.
+
+        A 401 response is retried once after refreshing the token, when
+        ``login()`` credentials or a ``token_refresh_callback`` are available.
 
         Args:
             method: HTTP method
             path: API path
             json: JSON body
             params: Query parameters
+            headers: Extra request headers
             **kwargs: Additional arguments for requests
 
         Returns:
-            Response data
+            The successful (2xx/3xx) response
 
         Raises:
             APIError: If the request fails
         """
         url = self._url(path)
-        headers = {}
+        token = self._token
 
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+        if json is not None:
+            kwargs["data"] = _dumps(json)
+            headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
 
         try:
             response = self.session.request(
                 method,
                 url,
-                json=json,
                 params=params,
                 headers=headers,
                 timeout=self.timeout,
@@ -110,37 +395,137 @@ class HyperSDK:
                 **kwargs,
             )
 
+            # Error responses are closed before raising so that a streamed
+            # request does not keep its pooled connection checked out
             if response.status_code == 404:
+                response.close()
                 raise JobNotFoundError(f"Resource not found: {path}")
 
             if response.status_code == 401:
+                response.close()
+                if (
+                    not _is_retry
+                    and path != "/api/login"
+                    and self._refresh_token(token)
+                ):
+                    return self._send(
+                        method, path, params=params, headers=headers,
+                        _is_retry=True, **kwargs,
+                    )
                 raise AuthenticationError("Authentication failed")
 
-            if not response.ok:
-                error_msg = response.text
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", error_msg)
-                except Exception:
-                    pass
-                raise APIError(
-                    f"API error: {error_msg}",
-                    status_code=response.status_code,
-                    response=response.json() if response.text else None,
-                )
-
-            if response.text:
-                return response.json()
-            return None
+            if response.status_code >= 400:
+                if kwargs.get("stream"):
+                    body = read_prefix(response, _MAX_ERROR_BODY)
+                else:
+                    body = response.content[:_MAX_ERROR_BODY]
+                response.close()
+                raise _api_error(response.status_code, body)
+
+            return response
 
-        except requests.RequestException as e:
+        except TRANSPORT_ERRORS as e:
             raise APIError(f"Request failed: {str(e)}")
 
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request to the API.
+
+        Args:
+            method: HTTP method
+            path: API path
+            json: JSON body
+            params: Query parameters
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            Response data
+
+        Raises:
+            APIError: If the request fails
+        """
+        response = self._send(method, path, json=json, params=params, **kwargs)
+        return self._decode(response)
+
+    def _decode(self, response: requests.Response) -> Any:
+        """Decode a JSON response body, or None if it is empty.
+
+        Uses orjson on the raw bytes when it is installed.
+        """
+        try:
+            content = response.content
+            if content:
+                return _loads(content)
+            return None
+        except ValueError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    def _conditional_get(self, path: str) -> Any:
+        """GET a rarely changing resource, revalidating it by ETag.
+
+        The last body and ETag are kept in memory (and under ``cache_dir``
+        when configured) and sent back as ``If-None-Match``; a 304 reply
+        reuses the cached body without downloading or parsing it again.
+
+        Args:
+            path: API path
+
+        Returns:
+            Response data
+        """
+        entry = self._etag_cache.get(path)
+        if entry is None and self.cache_dir:
+            entry = self._read_etag_file(path)
+        headers = {"If-None-Match": entry[0]} if entry else None
+
+        response = self._send("GET", path, headers=headers)
+        if response.status_code == 304 and entry:
+            return entry[1]
+
+        data = self._decode(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[path] = (etag, data)
+            if self.cache_dir:
+                self._write_etag_file(path, etag, data)
+        return data
+
+    def _etag_file(self, path: str) -> str:
+        key = hashlib.sha1((self.base_url + path).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_etag_file(self, path: str) -> Optional[Tuple[str, Any]]:
+        try:
+            with open(self._etag_file(path), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        entry = (cached["etag"], cached["data"])
+        self._etag_cache[path] = entry
+        return entry
+
+    def _write_etag_file(self, path: str, etag: str, data: Any) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._etag_file(path), "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "data": data}, f)
+        except OSError:
+            pass
+
     # Authentication
 
     def login(self, username: str, password: str) -> str:
         """Login and obtain session token.
 
+        The credentials are kept in memory so an expired token is renewed
+        transparently on the next 401 response, until ``logout()``.
+
         Args:
             username: Username
             password: Password
@@ -156,27 +541,36 @@ class HyperSDK:
             "/api/login",
             json={"username": username, "password": password},
         )
-        self._token = response["token"]
+        self._creds = (username, password)
+        self._set_token(response["token"])
         return self._token
 
     def logout(self) -> None:
         """Logout and invalidate session token."""
         self._request("POST", "/api/logout")
-        self._token = None
+        self._creds = None
+        self._set_token(None)
 
     # Health & Status
 
+    @ttl_cache(30)
     def health(self) -> Dict[str, Any]:
         """Check API health.
 
+        The result is cached for 30 seconds.
+
         Returns:
             Health status
         """
         return self._request("GET", "/health")
 
+    @ttl_cache(5)
     def status(self) -> DaemonStatus:
         """Get daemon status.
 
+        The result is cached for 5 seconds. Job reads (``get_job``,
+        ``list_jobs``, ``watch_job``) are never cached.
+
         Returns:
             Daemon status information
         """
@@ -186,10 +580,14 @@ class HyperSDK:
     def capabilities(self) -> Dict[str, Any]:
         """Get export capabilities.
 
+        Capabilities only change when the daemon is reconfigured, so the
+        response is revalidated with ``If-None-Match`` when the daemon
+        sends an ETag.
+
         Returns:
             Export capabilities
         """
-        return self._request("GET", "/capabilities")
+        return self._conditional_get("/capabilities")
 
     # Job Management
 
@@ -206,26 +604,33 @@ class HyperSDK:
             APIError: If submission fails
         """
         response = self._request("POST", "/jobs/submit", json=job_def.to_dict())
-        if response["accepted"] == 0:
-            errors = response.get("errors", ["Unknown error"])
-            raise APIError(f"Job submission failed: {errors[0]}")
-        return response["job_ids"][0]
+        return _submitted_job_id(response)
 
-    def submit_jobs(self, job_defs: List[JobDefinition]) -> List[str]:
+    def submit_jobs(
+        self,
+        job_defs: List[JobDefinition],
+        batch_size: int = 100,
+        max_concurrent: int = 1,
+    ) -> List[str]:
         """Submit multiple jobs.
 
+        Large lists are split into requests of at most ``batch_size`` jobs
+        to keep each request body bounded.
+
         Args:
             job_defs: List of job definitions
+            batch_size: Maximum number of jobs per request
+            max_concurrent: Number of requests to have in flight at once
 
         Returns:
             List of job IDs
 
         Raises:
-            APIError: If submission fails
+            APIError: If a request fails; ``partial`` on the error holds the
+                job IDs accepted by the batches that went through
         """
         jobs_data = [job.to_dict() for job in job_defs]
-        response = self._request("POST", "/jobs/submit", json=jobs_data)
-        return response["job_ids"]
+        return self._submit_batches(jobs_data, batch_size, max_concurrent)
 
     def get_job(self, job_id: str) -> Job:
         """Get job details.
@@ -242,6 +647,40 @@ class HyperSDK:
         data = self._request("GET", f"/jobs/{job_id}")
         return Job.from_dict(data)
 
+    def get_jobs(self, job_ids: List[str]) -> List[Job]:
+        """Get details for several jobs in a single request.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Jobs in the order requested; IDs the daemon does not know are
+            skipped rather than raising ``JobNotFoundError``
+        """
+        if not job_ids:
+            return []
+        response = self._request("POST", "/jobs/query", json={"job_ids": job_ids})
+        return _jobs(response)
+
+    def refresh_job(self, job: Job) -> Job:
+        """Refresh a job in place with its latest state.
+
+        Unlike ``get_job`` this reuses ``job`` (and its progress object)
+        instead of building new instances, which suits loops that poll one
+        job for a long time.
+
+        Args:
+            job: Job previously returned by the client
+
+        Returns:
+            The same job instance, updated
+
+        Raises:
+            JobNotFoundError: If job not found
+        """
+        data = self._request("GET", f"/jobs/{job.definition.id}")
+        return job.update_from_dict(data)
+
     def query_jobs(
         self,
         job_ids: Optional[List[str]] = None,
@@ -260,18 +699,9 @@ class HyperSDK:
         Returns:
             List of jobs
         """
-        request_data = {}
-        if job_ids:
-            request_data["job_ids"] = job_ids
-        if status:
-            request_data["status"] = [s.value for s in status]
-        if all:
-            request_data["all"] = True
-        if limit:
-            request_data["limit"] = limit
-
+        request_data = _query_body(job_ids, status, all, limit)
         response = self._request("POST", "/jobs/query", json=request_data)
-        return [Job.from_dict(job_data) for job_data in response["jobs"]]
+        return _jobs(response)
 
     def list_jobs(self, all: bool = True) -> List[Job]:
         """List all jobs.
@@ -284,7 +714,50 @@ class HyperSDK:
         """
         params = {"all": "true"} if all else {}
         response = self._request("GET", "/jobs/query", params=params)
-        return [Job.from_dict(job_data) for job_data in response["jobs"]]
+        return _jobs(response)
+
+    def iter_jobs(self, all: bool = True) -> Iterator[Job]:
+        """Iterate over jobs as they arrive.
+
+        Asks for newline-delimited JSON (``application/x-ndjson``) so each
+        job is parsed as soon as its line is received, without buffering the
+        whole list. If the daemon answers with a regular JSON document, the
+        jobs are parsed incrementally with ijson when it is installed (the
+        ``stream`` extra) and from the fully read document otherwise.
+
+        Args:
+            all: Return all jobs
+
+        Yields:
+            Jobs
+        """
+        params = {"all": "true"} if all else {}
+        response = self._send(
+            "GET",
+            "/jobs/query",
+            params=params,
+            headers={"Accept": "application/x-ndjson, application/json;q=0.9"},
+            stream=True,
+        )
+        try:
+            if response.headers.get("Content-Type", "").startswith("application/x-ndjson"):
+                for line in response.iter_lines():
+                    if line:
+                        yield Job.from_dict(_loads(line))
+            elif ijson is not None and isinstance(response, requests.Response):
+                response.raw.decode_content = True
+                for job_data in ijson.items(response.raw, "jobs.item", use_float=True):
+                    yield Job.from_dict(job_data)
+            else:
+                read_body(response)
+                for job_data in self._decode(response).get("jobs") or []:
+                    yield Job.from_dict(job_data)
+        except TRANSPORT_ERRORS as e:
+            raise APIError(f"Request failed: {str(e)}")
+        except _IJSON_ERRORS as e:
+            raise APIError(f"Request failed: {str(e)}")
+        finally:
+            response.close()
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job.
@@ -298,24 +771,85 @@ class HyperSDK:
         Raises:
             APIError: If cancellation fails
         """
-        response = self._request("POST", "/jobs/cancel", json={"job_ids": [job_id]})
-        if job_id in response["cancelled"]:
-            return True
-        if job_id in response["failed"]:
-            error = response["errors"].get(job_id, "Unknown error")
-            raise APIError(f"Failed to cancel job: {error}")
-        return False
+        return _cancelled(job_id, self.cancel_jobs([job_id]))
 
-    def cancel_jobs(self, job_ids: List[str]) -> Dict[str, Any]:
+    def cancel_jobs(
+        self,
+        job_ids: List[str],
+        batch_size: int = 100,
+        max_concurrent: int = 1,
+    ) -> Dict[str, Any]:
         """Cancel multiple jobs.
 
         Args:
             job_ids: List of job IDs to cancel
+            batch_size: Maximum number of job IDs per request
+            max_concurrent: Number of requests to have in flight at once
 
         Returns:
             Cancel results with cancelled and failed lists
+
+        Raises:
+            APIError: If a request fails; ``partial`` on the error holds the
+                merged results of the batches that went through
+        """
+        batches = [{"job_ids": ids} for ids in _chunks(job_ids, batch_size)]
+        responses, error = self._post_batches("/jobs/cancel", batches, max_concurrent)
+        if error is None and len(responses) == 1:
+            return responses[0]
+
+        result: Dict[str, Any] = {"cancelled": [], "failed": [], "errors": {}}
+        for response in responses:
+            result["cancelled"].extend(response.get("cancelled") or [])
+            result["failed"].extend(response.get("failed") or [])
+            result["errors"].update(response.get("errors") or {})
+        if error is not None:
+            error.partial = result
+            raise error
+        return result
+
+    def _submit_batches(
+        self, jobs_data: List[Dict[str, Any]], batch_size: int, max_concurrent: int
+    ) -> List[str]:
+        """Submit ``jobs_data`` in batches and return the accepted job IDs."""
+        responses, error = self._post_batches(
+            "/jobs/submit", _chunks(jobs_data, batch_size), max_concurrent
+        )
+        job_ids = [job_id for response in responses for job_id in response["job_ids"]]
+        if error is not None:
+            error.partial = job_ids
+            raise error
+        return job_ids
+
+    def _post_batches(
+        self, path: str, batches: List[Any], max_concurrent: int
+    ) -> Tuple[List[Any], Optional[APIError]]:
+        """POST each batch to ``path``.
+
+        Returns:
+            The responses of the batches that went through, in order, and
+            the first ``APIError`` (None if every batch succeeded). Sequential
+            batches stop at the first failure; concurrent ones all run.
         """
-        return self._request("POST", "/jobs/cancel", json={"job_ids": job_ids})
+        post = partial(self._request, "POST", path)
+        responses: List[Any] = []
+        if max_concurrent <= 1 or len(batches) <= 1:
+            for batch in batches:
+                try:
+                    responses.append(post(json=batch))
+                except APIError as e:
+                    return responses, e
+            return responses, None
+
+        error = None
+        with ThreadPoolExecutor(max_workers=min(max_concurrent, len(batches))) as pool:
+            futures = [pool.submit(post, json=batch) for batch in batches]
+            for future in futures:
+                try:
+                    responses.append(future.result())
+                except APIError as e:
+                    error = error or e
+        return responses, error
 
     def get_job_progress(self, job_id: str) -> JobProgress:
         """Get job progress.
@@ -329,25 +863,123 @@ class HyperSDK:
         data = self._request("GET", f"/jobs/progress/{job_id}")
         return JobProgress.from_dict(data)
 
-    def get_job_logs(self, job_id: str) -> str:
+    def get_jobs_progress(
+        self, job_ids: List[str]
+    ) -> Dict[str, Optional[JobProgress]]:
+        """Get progress for several jobs in a single request.
+
+        Progress is taken from the job records returned by ``/jobs/query``
+        instead of calling ``/jobs/progress`` once per job.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Mapping of job ID to progress (None if the job has not reported
+            any yet); IDs the daemon does not know are omitted
+        """
+        return {job.definition.id: job.progress for job in self.get_jobs(job_ids)}
+
+    def get_job_logs(
+        self,
+        job_id: str,
+        sink: Optional[BinaryIO] = None,
+        chunk_size: int = 65536,
+    ) -> Optional[str]:
         """Get job logs.
 
+        With a ``sink`` the log is streamed into it in ``chunk_size`` pieces,
+        so memory use stays bounded however large the log is.
+
         Args:
             job_id: Job ID
+            sink: Optional binary file-like object to write the raw log to
+            chunk_size: Bytes to read per chunk when streaming to ``sink``
 
         Returns:
-            Job logs as string
+            Job logs as string, or None when written to ``sink``
         """
-        url = self._url(f"/jobs/logs/{job_id}")
-        response = self.session.get(
-            url,
-            headers={"Authorization": f"Bearer {self._token}"} if self._token else {},
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
-        if not response.ok:
-            raise APIError(f"Failed to get logs: {response.text}")
-        return response.text
+        if sink is None:
+            return self._send("GET", f"/jobs/logs/{job_id}").text
+
+        for chunk in self.iter_job_logs(job_id, chunk_size):
+            sink.write(chunk)
+        return None
+
+    def iter_job_logs(self, job_id: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Iterate over a job's raw log as it is received.
+
+        Chunks are yielded as they arrive, so consumers can start processing
+        before the whole log has been downloaded and memory use stays
+        bounded, with either transport.
+
+        Args:
+            job_id: Job ID
+            chunk_size: Bytes to read per chunk
+
+        Yields:
+            Raw log chunks
+        """
+        response = self._send("GET", f"/jobs/logs/{job_id}", stream=True)
+        try:
+            yield from iter_bytes(response, chunk_size)
+        except TRANSPORT_ERRORS as e:
+            raise APIError(f"Request failed: {str(e)}")
+        finally:
+            response.close()
+
+    def watch_job(
+        self,
+        job_id: str,
+        poll_interval: float = 3.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        stop: Optional[threading.Event] = None,
+        reuse: bool = False,
+    ) -> Iterator[Job]:
+        """Watch a job until it reaches a terminal state.
+
+        The daemon has no push channel for job updates, so this polls
+        ``get_job`` over the pooled keep-alive session and only yields a
+        snapshot when the status or progress changed since the last one.
+        The poll interval grows by ``backoff`` while the job is unchanged
+        (up to ``max_interval``), holds while only the percentage moves, and
+        drops back to ``poll_interval`` when the status or phase changes,
+        with +/-20% jitter so concurrent watchers spread out.
+
+        Args:
+            job_id: Job ID
+            poll_interval: Seconds between polls after a status or phase change
+            max_interval: Upper bound for the poll interval
+            backoff: Interval multiplier applied after an unchanged poll
+            stop: Optional event that ends the watch early; setting it also
+                cuts the current wait short
+            reuse: Refresh one ``Job`` in place with ``refresh_job`` instead
+                of building a new one per poll; every snapshot is then the
+                same instance, so copy it to keep earlier states
+
+        Yields:
+            Job snapshots, ending with the terminal one
+
+        Raises:
+            JobNotFoundError: If job not found
+        """
+        policy = _WatchPolicy(poll_interval, max_interval, backoff)
+        job = None
+        while True:
+            if reuse and job is not None:
+                job = self.refresh_job(job)
+            else:
+                job = self.get_job(job_id)
+            if policy.observe(job):
+                yield job
+            if job.status in _TERMINAL_STATUSES:
+                return
+            delay = policy.delay()
+            if stop is None:
+                time.sleep(delay)
+            elif stop.wait(delay):
+                return
 
     def get_job_eta(self, job_id: str) -> str:
         """Get job estimated time of arrival.
@@ -633,6 +1265,8 @@ class HyperSDK:
         transfer_gb: float = 0,
         requests: int = 0,
         duration_days: int = 30,
+        sort_by: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Compare costs across multiple cloud providers.
 
@@ -641,11 +1275,15 @@ class HyperSDK:
             transfer_gb: Data transfer out in GB
             requests: Number of API requests
             duration_days: Duration in days
+            sort_by: Optional estimate field (e.g. ``"total_cost"``) to order
+                ``estimates`` by, ascending; by default the daemon's order
+                is kept
+            limit: Keep only the first ``limit`` estimates after sorting
 
         Returns:
             Cost comparison across S3, Azure Blob, and GCS
         """
-        return self._request(
+        comparison = self._request(
             "POST",
             "/cost/compare",
             json={
@@ -655,6 +1293,12 @@ class HyperSDK:
                 "duration_days": duration_days,
             },
         )
+        estimates = comparison.get("estimates") or []
+        if sort_by:
+            estimates.sort(key=itemgetter(sort_by))
+        if limit is not None:
+            del estimates[limit:]
+        return comparison
 
     def project_yearly_cost(
         self,
@@ -937,6 +1581,7 @@ class HyperSDK:
 
     # Carbon-Aware Scheduling
 
+    @ttl_cache(_CARBON_STATUS_TTL)
     def get_carbon_status(
         self,
         zone: str = "US-CAL-CISO",
@@ -944,6 +1589,9 @@ class HyperSDK:
     ) -> CarbonStatus:
         """Get current grid carbon status for a zone.
 
+        Grid intensity changes at ~5 minute granularity, so results are cached
+        per (zone, threshold) for 60 seconds.
+
         Args:
             zone: Carbon zone ID (default: US-CAL-CISO)
             threshold: Carbon intensity threshold in gCO2/kWh (default: 200.0)
@@ -962,7 +1610,53 @@ class HyperSDK:
             "/carbon/status",
             json={"zone": zone, "threshold": threshold}
         )
-        return CarbonStatus.from_dict(data)
+        status = CarbonStatus.from_dict(data)
+        # Keep the forecast around so estimate_carbon_savings can be answered locally
+        self._carbon_statuses[zone] = (time.monotonic() + _CARBON_STATUS_TTL, status)
+        return status
+
+    def get_carbon_status_batch(
+        self,
+        zones: List[str],
+        threshold: float = 200.0,
+        max_workers: int = 8,
+    ) -> Dict[str, Union[CarbonStatus, HyperSDKError]]:
+        """Get grid carbon status for several zones at once.
+
+        The daemon has no multi-zone endpoint, so the per-zone requests are
+        issued concurrently over the pooled session; wall-clock time is one
+        round trip rather than one per zone. Cached zones are not refetched.
+        A zone that fails does not discard the others: its entry holds the
+        error instead of a status.
+
+        Args:
+            zones: Carbon zone IDs
+            threshold: Carbon intensity threshold in gCO2/kWh (default: 200.0)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Mapping of zone ID to carbon status, or to the ``HyperSDKError``
+            raised for that zone, in the order given
+
+        Example:
+            >>> statuses = client.get_carbon_status_batch(["US-CAL-CISO", "DE", "SE"])
+            >>> for zone, status in statuses.items():
+            ...     if isinstance(status, HyperSDKError):
+            ...         print(f"{zone}: {status}")
+            ...     else:
+            ...         print(f"{zone}: {status.current_intensity} gCO2/kWh")
+        """
+        if not zones:
+            return {}
+
+        def fetch(zone: str) -> Union[CarbonStatus, HyperSDKError]:
+            try:
+                return self.get_carbon_status(zone, threshold)
+            except HyperSDKError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(zones))) as pool:
+            return dict(zip(zones, pool.map(fetch, zones)))
 
     def get_carbon_report(
         self,
@@ -1009,9 +1703,14 @@ class HyperSDK:
         )
         return CarbonReport.from_dict(data)
 
+    @ttl_cache(3600)
     def list_carbon_zones(self) -> List[CarbonZone]:
         """List all available carbon zones.
 
+        Zone metadata is effectively static, so the list is cached for an hour
+        and then revalidated with ``If-None-Match`` when the daemon sends an
+        ETag.
+
         Returns:
             List of carbon zones with metadata
 
@@ -1020,7 +1719,7 @@ class HyperSDK:
             >>> for zone in zones:
             ...     print(f"{zone.id}: {zone.name} ({zone.typical_intensity} gCO2/kWh)")
         """
-        data = self._request("GET", "/carbon/zones")
+        data = self._conditional_get("/carbon/zones")
         return [CarbonZone.from_dict(z) for z in data["zones"]]
 
     def estimate_carbon_savings(
@@ -1031,6 +1730,9 @@ class HyperSDK:
     ) -> CarbonEstimate:
         """Estimate carbon savings from delaying a backup.
 
+        If a carbon status for the zone was fetched within the last minute,
+        the estimate is computed from its forecast without another request.
+
         Args:
             zone: Carbon zone ID
             data_size_gb: Data size in GB
@@ -1047,7 +1749,23 @@ class HyperSDK:
             ... )
             >>> print(f"Savings: {estimate.savings_kg_co2} kg CO2 ({estimate.savings_percent}%)")
             >>> print(f"Recommendation: {estimate.recommendation}")
+
+        Raises:
+            APIError: If ``data_size_gb`` or ``duration_hours`` is not
+                positive (checked locally, as the daemon would reject it)
         """
+        # Same checks and 400 error as the daemon's /carbon/estimate handler,
+        # so the cached path does not accept input the API would reject
+        for name, value in (
+            ("data_size_gb", data_size_gb), ("duration_hours", duration_hours)
+        ):
+            if not value > 0:
+                raise APIError(f"API error: {name} must be positive", status_code=400)
+
+        cached = self._carbon_statuses.get(zone)
+        if cached is not None and cached[0] > time.monotonic() and cached[1].forecast:
+            return CarbonEstimate.from_status(cached[1], data_size_gb, duration_hours)
+
         data = self._request(
             "POST",
             "/carbon/estimate",
@@ -1088,24 +1806,67 @@ class HyperSDK:
         """
         # Add carbon metadata to job
         job_dict = job_def.to_dict()
-        if "metadata" not in job_dict:
-            job_dict["metadata"] = {}
-
-        job_dict["metadata"]["carbon_aware"] = True
-        job_dict["metadata"]["carbon_zone"] = carbon_zone
-        job_dict["metadata"]["carbon_max_intensity"] = max_intensity
-        job_dict["metadata"]["carbon_max_delay"] = int(max_delay_hours * 3600 * 1_000_000_000)  # Convert to nanoseconds
+        job_dict.setdefault("metadata", {}).update(
+            _carbon_metadata(carbon_zone, max_intensity, max_delay_hours)
+        )
 
         response = self._request("POST", "/jobs/submit", json=job_dict)
-        if response["accepted"] == 0:
-            errors = response.get("errors", ["Unknown error"])
-            raise APIError(f"Job submission failed: {errors[0]}")
-        return response["job_ids"][0]
+        return _submitted_job_id(response)
+
+    def submit_carbon_aware_jobs(
+        self,
+        job_defs: List[JobDefinition],
+        carbon_zone: str = "US-CAL-CISO",
+        max_intensity: float = 200.0,
+        max_delay_hours: float = 4.0,
+        batch_size: int = 100,
+        max_concurrent: int = 1,
+    ) -> List[str]:
+        """Submit several carbon-aware jobs in batched requests.
+
+        All jobs share the same carbon settings; like ``submit_jobs``, large
+        lists are split into requests of at most ``batch_size`` jobs.
+
+        Args:
+            job_defs: Job definitions
+            carbon_zone: Carbon zone ID (default: US-CAL-CISO)
+            max_intensity: Maximum carbon intensity threshold (default: 200.0 gCO2/kWh)
+            max_delay_hours: Maximum delay in hours (default: 4.0)
+            batch_size: Maximum number of jobs per request
+            max_concurrent: Number of requests to have in flight at once
+
+        Returns:
+            Job IDs of the accepted jobs
+
+        Raises:
+            APIError: If a request fails; ``partial`` on the error holds the
+                job IDs accepted by the batches that went through
+        """
+        metadata = _carbon_metadata(carbon_zone, max_intensity, max_delay_hours)
+        jobs_data = []
+        for job_def in job_defs:
+            job_dict = job_def.to_dict()
+            job_dict.setdefault("metadata", {}).update(metadata)
+            jobs_data.append(job_dict)
+        return self._submit_batches(jobs_data, batch_size, max_concurrent)
 
     def close(self) -> None:
-        """Close the client session."""
+        """Close the client session.
+
+        Releases the pooled connections without logging out, so a token
+        shared with other clients stays valid; call ``logout`` explicitly
+        to end the daemon session.
+        """
+        self.invalidate_cache()
         self.session.close()
 
+    def __del__(self):
+        """Release pooled connections if the client was never closed."""
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -1115,5 +1876,397 @@ class HyperSDK:
         self.close()
 
 
-# Alias for backward compatibility
-AsyncHyperSDK = HyperSDK  # TODO: Implement true async client with aiohttp
+
+class AsyncHyperSDK:
+    """Asynchronous HyperSDK API client built on aiohttp.
+
+    Requires the ``async`` extra (``pip install "hypersdk[async]"``). All
+    calls share one aiohttp session, so independent requests can be run
+    concurrently with ``asyncio.gather``.
+
+    Example:
+        >>> async with AsyncHyperSDK("http://localhost:8080") as client:
+        ...     health, status = await asyncio.gather(
+        ...         client.health(), client.status()
+        ...     )
+        ...     job_id = await client.submit_job(job_def)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        pool_maxsize: int = 16,
+    ):
+        """Initialize the async HyperSDK client.
+
+        The underlying aiohttp session is created on first use, inside the
+        running event loop.
+
+        Args:
+            base_url: Base URL of the HyperSDK API (e.g., "http://localhost:8080")
+            api_key: Optional API key for authentication
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of pooled connections to the daemon
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncHyperSDK requires aiohttp: pip install "hypersdk[async]"'
+            )
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.pool_maxsize = pool_maxsize
+        self._token: Optional[str] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            headers = {"X-API-Key": self.api_key} if self.api_key else None
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    ssl=None if self.verify_ssl else False,
+                ),
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Any] = None,
+        params: Optional[Dict] = None,
+    ) -> Any:
+        """Make HTTP request to the API.
+
+        Args:
+            method: HTTP method
+            path: API path
+            json: JSON body
+            params: Query parameters
+
+        Returns:
+            Response data
+
+        Raises:
+            APIError: If the request fails
+        """
+        headers = {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+        data = None
+        if json is not None:
+            data = _dumps(json)
+            headers.update(_JSON_HEADERS)
+
+        try:
+            async with self._get_session().request(
+                method,
+                self.base_url + path,
+                data=data,
+                params=params,
+                headers=headers,
+            ) as response:
+                if response.status < 400:
+                    body = await response.read()
+                elif response.status not in (401, 404):
+                    # Read only the start of the error body; the rest is
+                    # discarded when the response is released
+                    body = b""
+                    while len(body) < _MAX_ERROR_BODY:
+                        chunk = await response.content.read(_MAX_ERROR_BODY - len(body))
+                        if not chunk:
+                            break
+                        body += chunk
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+        if response.status == 404:
+            raise JobNotFoundError(f"Resource not found: {path}")
+
+        if response.status == 401:
+            raise AuthenticationError("Authentication failed")
+
+        if response.status >= 400:
+            raise _api_error(response.status, body)
+
+        try:
+            return _loads(body) if body else None
+        except ValueError as e:
+            raise APIError(f"Request failed: {str(e)}")
+
+    # Authentication
+
+    async def login(self, username: str, password: str) -> str:
+        """Login and obtain session token.
+
+        Args:
+            username: Username
+            password: Password
+
+        Returns:
+            Session token
+
+        Raises:
+            AuthenticationError: If login fails
+        """
+        response = await self._request(
+            "POST",
+            "/api/login",
+            json={"username": username, "password": password},
+        )
+        self._token = response["token"]
+        return self._token
+
+    async def logout(self) -> None:
+        """Logout and invalidate session token."""
+        await self._request("POST", "/api/logout")
+        self._token = None
+
+    # Health & Status
+
+    async def health(self) -> Dict[str, Any]:
+        """Check API health.
+
+        Returns:
+            Health status
+        """
+        return await self._request("GET", "/health")
+
+    async def status(self) -> DaemonStatus:
+        """Get daemon status.
+
+        Returns:
+            Daemon status information
+        """
+        data = await self._request("GET", "/status")
+        return DaemonStatus.from_dict(data)
+
+    # Job Management
+
+    async def submit_job(self, job_def: JobDefinition) -> str:
+        """Submit a single job.
+
+        Args:
+            job_def: Job definition
+
+        Returns:
+            Job ID
+
+        Raises:
+            APIError: If submission fails
+        """
+        response = await self._request("POST", "/jobs/submit", json=job_def.to_dict())
+        return _submitted_job_id(response)
+
+    async def submit_jobs(self, job_defs: List[JobDefinition]) -> List[str]:
+        """Submit multiple jobs.
+
+        Args:
+            job_defs: List of job definitions
+
+        Returns:
+            List of job IDs
+
+        Raises:
+            APIError: If submission fails
+        """
+        jobs_data = [job.to_dict() for job in job_defs]
+        response = await self._request("POST", "/jobs/submit", json=jobs_data)
+        return response["job_ids"]
+
+    async def get_job(self, job_id: str) -> Job:
+        """Get job details.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job information
+
+        Raises:
+            JobNotFoundError: If job not found
+        """
+        data = await self._request("GET", f"/jobs/{job_id}")
+        return Job.from_dict(data)
+
+    async def query_jobs(
+        self,
+        job_ids: Optional[List[str]] = None,
+        status: Optional[List[JobStatus]] = None,
+        all: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
+        """Query jobs with filters.
+
+        Args:
+            job_ids: Filter by specific job IDs
+            status: Filter by job status
+            all: Return all jobs
+            limit: Limit number of results
+
+        Returns:
+            List of jobs
+        """
+        request_data = _query_body(job_ids, status, all, limit)
+        response = await self._request("POST", "/jobs/query", json=request_data)
+        return _jobs(response)
+
+    async def list_jobs(self, all: bool = True) -> List[Job]:
+        """List all jobs.
+
+        Args:
+            all: Return all jobs
+
+        Returns:
+            List of all jobs
+        """
+        params = {"all": "true"} if all else {}
+        response = await self._request("GET", "/jobs/query", params=params)
+        return _jobs(response)
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """Cancel a running job.
+
+        Args:
+            job_id: Job ID to cancel
+
+        Returns:
+            True if cancelled successfully
+
+        Raises:
+            APIError: If cancellation fails
+        """
+        return _cancelled(job_id, await self.cancel_jobs([job_id]))
+
+    async def get_job_progress(self, job_id: str) -> JobProgress:
+        """Get job progress.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job progress information
+        """
+        data = await self._request("GET", f"/jobs/progress/{job_id}")
+        return JobProgress.from_dict(data)
+
+    async def get_jobs_progress(
+        self, job_ids: List[str]
+    ) -> Dict[str, Optional[JobProgress]]:
+        """Get progress for several jobs in a single request.
+
+        Progress is taken from the job records returned by ``/jobs/query``
+        instead of calling ``/jobs/progress`` once per job.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Mapping of job ID to progress (None if the job has not reported
+            any yet); IDs the daemon does not know are omitted
+        """
+        jobs = await self.get_jobs(job_ids)
+        return {job.definition.id: job.progress for job in jobs}
+
+    async def get_jobs(self, job_ids: List[str]) -> List[Job]:
+        """Get details for several jobs in a single request.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Jobs in the order requested; IDs the daemon does not know are
+            skipped rather than raising ``JobNotFoundError``
+        """
+        if not job_ids:
+            return []
+        response = await self._request(
+            "POST", "/jobs/query", json={"job_ids": job_ids}
+        )
+        return _jobs(response)
+
+    async def cancel_jobs(self, job_ids: List[str]) -> Dict[str, Any]:
+        """Cancel multiple jobs.
+
+        Args:
+            job_ids: List of job IDs to cancel
+
+        Returns:
+            Cancel results with cancelled and failed lists
+        """
+        return await self._request("POST", "/jobs/cancel", json={"job_ids": job_ids})
+
+    async def watch_job(
+        self,
+        job_id: str,
+        poll_interval: float = 3.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+    ) -> AsyncIterator[Job]:
+        """Watch a job until it reaches a terminal state.
+
+        Same polling policy as ``HyperSDK.watch_job``; waiting happens on the
+        event loop, so many jobs can be watched concurrently from one thread.
+        Cancel the consuming task to stop early.
+
+        Args:
+            job_id: Job ID
+            poll_interval: Seconds between polls after a status or phase change
+            max_interval: Upper bound for the poll interval
+            backoff: Interval multiplier applied after an unchanged poll
+
+        Yields:
+            Job snapshots, ending with the terminal one
+
+        Raises:
+            JobNotFoundError: If job not found
+        """
+        policy = _WatchPolicy(poll_interval, max_interval, backoff)
+        while True:
+            job = await self.get_job(job_id)
+            if policy.observe(job):
+                yield job
+            if job.status in _TERMINAL_STATUSES:
+                return
+            await asyncio.sleep(policy.delay())
+
+    # Hyper2KVM Integration
+
+    async def get_conversion_status(self, conversion_id: str) -> Dict[str, Any]:
+        """Get VM conversion status.
+
+        Args:
+            conversion_id: Conversion ID
+
+        Returns:
+            Conversion status
+        """
+        return await self._request(
+            "GET", "/convert/status", params={"conversion_id": conversion_id}
+        )
+
+    async def close(self) -> None:
+        """Close the client session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -3,33 +3,49 @@
 
 class HyperSDKError(Exception):
     """Base exception for all HyperSDK errors."""
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(HyperSDKError):
     """Authentication failed."""
-    pass
+    __slots__ = ()
 
 
 class JobNotFoundError(HyperSDKError):
     """Job not found."""
-    pass
+    __slots__ = ()
 
 
 class APIError(HyperSDKError):
-    """API request failed."""
-
-    def __init__(self, message: str, status_code: int = None, response: dict = None):
+    """API request failed.
+
+    For batched calls (``submit_jobs``, ``cancel_jobs``) ``partial`` holds
+    the merged results of the batches that went through before the failure.
+    """
+    __slots__ = ("status_code", "response", "partial")
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int = None,
+        response: dict = None,
+        partial=None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        self.partial = partial
+
+    def __reduce__(self):
+        # Slot attributes are not part of the default exception pickle state
+        return type(self), (*self.args, self.status_code, self.response, self.partial)
 
 
 class ValidationError(HyperSDKError):
     """Request validation failed."""
-    pass
+    __slots__ = ()
 
 
 class WebSocketError(HyperSDKError):
     """WebSocket connection error."""
-    pass
+    __slots__ = ()
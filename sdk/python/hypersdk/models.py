@@ -1,10 +1,26 @@
 """HyperSDK data models."""
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from typing import Optional, List, Dict, Any
 
+# Models are created in bulk from list responses; on Python 3.10+ give them
+# __slots__ so instances carry no per-object __dict__.
+if sys.version_info >= (3, 10):
+    _model = partial(dataclass, slots=True)
+else:  # pragma: no cover - Python < 3.10
+    _model = dataclass
+
+# Python 3.11+ parses the trailing "Z" the daemon sends natively.
+if sys.version_info >= (3, 11):
+    _parse_dt = datetime.fromisoformat
+else:  # pragma: no cover - Python < 3.11
+    def _parse_dt(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class JobStatus(str, Enum):
     """Job status enum."""
@@ -33,7 +49,26 @@ class ExportMethod(str, Enum):
     AUTO = ""
 
 
-@dataclass
+# Value -> member tables, so from_dict avoids the Enum.__call__ machinery
+_JOB_STATUSES = JobStatus._value2member_map_
+_EXPORT_FORMATS = ExportFormat._value2member_map_
+_EXPORT_METHODS = ExportMethod._value2member_map_
+
+
+def _lookup(members: Dict[Any, Any], enum_cls: type, value: Any) -> Any:
+    """Return the enum member for ``value``, raising ValueError if unknown."""
+    try:
+        return members[value]
+    except KeyError:
+        return enum_cls(value)
+
+
+def _lookup_or_raw(members: Dict[Any, Any], enum_cls: type, value: Any) -> Any:
+    """Return the enum member for ``value``, or ``value`` itself if unknown."""
+    return members.get(value, value)
+
+
+@_model
 class VCenterConfig:
     """vCenter connection configuration."""
     server: str
@@ -42,10 +77,15 @@ class VCenterConfig:
     insecure: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "server": self.server,
+            "username": self.username,
+            "password": self.password,
+            "insecure": self.insecure,
+        }
 
 
-@dataclass
+@_model
 class ExportOptions:
     """Export options configuration."""
     parallel_downloads: int = 4
@@ -66,10 +106,32 @@ class ExportOptions:
     libvirt_pool: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        data = {
+            "parallel_downloads": self.parallel_downloads,
+            "remove_cdrom": self.remove_cdrom,
+            "show_individual_progress": self.show_individual_progress,
+            "enable_pipeline": self.enable_pipeline,
+            "pipeline_inspect": self.pipeline_inspect,
+            "pipeline_fix": self.pipeline_fix,
+            "pipeline_convert": self.pipeline_convert,
+            "pipeline_validate": self.pipeline_validate,
+            "pipeline_compress": self.pipeline_compress,
+            "compress_level": self.compress_level,
+            "libvirt_integration": self.libvirt_integration,
+            "libvirt_autostart": self.libvirt_autostart,
+        }
+        if self.hyper2kvm_path is not None:
+            data["hyper2kvm_path"] = self.hyper2kvm_path
+        if self.libvirt_uri is not None:
+            data["libvirt_uri"] = self.libvirt_uri
+        if self.libvirt_bridge is not None:
+            data["libvirt_bridge"] = self.libvirt_bridge
+        if self.libvirt_pool is not None:
+            data["libvirt_pool"] = self.libvirt_pool
+        return data
 
 
-@dataclass
+@_model
 class JobDefinition:
     """VM export job definition."""
     vm_path: str
@@ -93,6 +155,9 @@ class JobDefinition:
     def to_dict(self) -> Dict[str, Any]:
         data = {
             "vm_path": self.vm_path,
+            "compress": self.compress,
+            "thin": self.thin,
+            "insecure": self.insecure,
         }
         if self.name:
             data["name"] = self.name
@@ -110,23 +175,48 @@ class JobDefinition:
             data["username"] = self.username
         if self.datacenter:
             data["datacenter"] = self.datacenter
+        # Raw strings are kept for values this SDK has no member for
         if self.format:
-            data["format"] = self.format.value
+            data["format"] = getattr(self.format, "_value_", self.format)
         if self.export_method:
-            data["export_method"] = self.export_method.value
+            data["export_method"] = getattr(
+                self.export_method, "_value_", self.export_method
+            )
         if self.method:
             data["method"] = self.method
-        data["compress"] = self.compress
-        data["thin"] = self.thin
-        data["insecure"] = self.insecure
         if self.options:
             data["options"] = self.options.to_dict()
         if self.created_at:
             data["created_at"] = self.created_at.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], strict: bool = True) -> "JobDefinition":
+        """Build a job definition from an API response.
+
+        With ``strict=False`` a format or export method this SDK does not
+        know is kept as the raw string instead of raising ValueError.
+        """
+        get = data.get
+        lookup = _lookup if strict else _lookup_or_raw
+        return cls(
+            vm_path=data["vm_path"],
+            name=get("name"),
+            id=get("id"),
+            output_path=get("output_path"),
+            output_dir=get("output_dir"),
+            vcenter_url=get("vcenter_url"),
+            username=get("username"),
+            datacenter=get("datacenter"),
+            format=lookup(_EXPORT_FORMATS, ExportFormat, get("format", "ovf")),
+            export_method=lookup(_EXPORT_METHODS, ExportMethod, get("export_method", "")),
+            compress=get("compress", False),
+            thin=get("thin", False),
+            insecure=get("insecure", False),
+        )
+
 
-@dataclass
+@_model
 class JobProgress:
     """Job progress information."""
     phase: str
@@ -143,10 +233,17 @@ class JobProgress:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JobProgress":
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in _JOB_PROGRESS_FIELDS})
+
+
+_JOB_PROGRESS_DEFAULTS = tuple((f.name, f.default) for f in fields(JobProgress))
+_JOB_PROGRESS_FIELDS = frozenset(name for name, _ in _JOB_PROGRESS_DEFAULTS)
+_JOB_PROGRESS_REQUIRED = frozenset(
+    name for name, default in _JOB_PROGRESS_DEFAULTS if default is MISSING
+)
 
 
-@dataclass
+@_model
 class JobResult:
     """Job result information."""
     vm_name: str
@@ -176,7 +273,7 @@ class JobResult:
         )
 
 
-@dataclass
+@_model
 class Job:
     """Complete job information."""
     definition: JobDefinition
@@ -190,44 +287,65 @@ class Job:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Job":
-        definition_data = data["definition"]
-        definition = JobDefinition(
-            vm_path=definition_data["vm_path"],
-            name=definition_data.get("name"),
-            id=definition_data.get("id"),
-            output_path=definition_data.get("output_path"),
-            output_dir=definition_data.get("output_dir"),
-            vcenter_url=definition_data.get("vcenter_url"),
-            username=definition_data.get("username"),
-            datacenter=definition_data.get("datacenter"),
-            format=ExportFormat(definition_data.get("format", "ovf")),
-            export_method=ExportMethod(definition_data.get("export_method", "")),
-            compress=definition_data.get("compress", False),
-            thin=definition_data.get("thin", False),
-            insecure=definition_data.get("insecure", False),
-        )
-
-        progress = None
-        if data.get("progress"):
-            progress = JobProgress.from_dict(data["progress"])
-
-        result = None
-        if data.get("result"):
-            result = JobResult.from_dict(data["result"])
+        get = data.get
+        progress = get("progress")
+        result = get("result")
+        started_at = get("started_at")
+        completed_at = get("completed_at")
 
         return cls(
-            definition=definition,
-            status=JobStatus(data["status"]),
-            updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
-            progress=progress,
-            result=result,
-            error=data.get("error"),
-            started_at=datetime.fromisoformat(data["started_at"].replace("Z", "+00:00")) if data.get("started_at") else None,
-            completed_at=datetime.fromisoformat(data["completed_at"].replace("Z", "+00:00")) if data.get("completed_at") else None,
+            definition=JobDefinition.from_dict(data["definition"]),
+            status=_lookup(_JOB_STATUSES, JobStatus, data["status"]),
+            updated_at=_parse_dt(data["updated_at"]),
+            progress=JobProgress.from_dict(progress) if progress else None,
+            result=JobResult.from_dict(result) if result else None,
+            error=get("error"),
+            started_at=_parse_dt(started_at) if started_at else None,
+            completed_at=_parse_dt(completed_at) if completed_at else None,
         )
 
-
-@dataclass
+    def update_from_dict(self, data: Dict[str, Any]) -> "Job":
+        """Update this job in place from an API response.
+
+        The definition is kept as is since it does not change after
+        submission, and an existing progress object is updated rather than
+        replaced. Otherwise the result matches ``Job.from_dict(data)``.
+
+        Raises:
+            TypeError: If the progress data lacks a required field; the job
+                is left unchanged
+        """
+        progress_data = data.get("progress")
+        if progress_data and self.progress is not None:
+            missing = _JOB_PROGRESS_REQUIRED.difference(progress_data)
+            if missing:
+                raise TypeError(
+                    f"JobProgress missing required fields: {', '.join(sorted(missing))}"
+                )
+
+        self.status = _lookup(_JOB_STATUSES, JobStatus, data["status"])
+        self.updated_at = _parse_dt(data["updated_at"])
+
+        if not progress_data:
+            self.progress = None
+        elif self.progress is None:
+            self.progress = JobProgress.from_dict(progress_data)
+        else:
+            for name, default in _JOB_PROGRESS_DEFAULTS:
+                setattr(self.progress, name, progress_data.get(name, default))
+
+        get = data.get
+        result = get("result")
+        self.result = JobResult.from_dict(result) if result else None
+        self.error = get("error")
+        started_at = get("started_at")
+        completed_at = get("completed_at")
+        self.started_at = _parse_dt(started_at) if started_at else None
+        self.completed_at = _parse_dt(completed_at) if completed_at else None
+        return self
+
+
+@_model
 class ScheduledJob:
     """Scheduled job configuration."""
     name: str
@@ -261,16 +379,12 @@ class ScheduledJob:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScheduledJob":
-        job_template_data = data["job_template"]
-        job_template = JobDefinition(
-            vm_path=job_template_data["vm_path"],
-            name=job_template_data.get("name"),
-        )
-
         return cls(
             name=data["name"],
             schedule=data["schedule"],
-            job_template=job_template,
+            # The daemon stores templates as given, so they may carry values
+            # the ExportFormat/ExportMethod enums do not list
+            job_template=JobDefinition.from_dict(data["job_template"], strict=False),
             id=data.get("id"),
             description=data.get("description"),
             enabled=data.get("enabled", True),
@@ -279,7 +393,7 @@ class ScheduledJob:
         )
 
 
-@dataclass
+@_model
 class Webhook:
     """Webhook configuration."""
     url: str
@@ -287,14 +401,18 @@ class Webhook:
     headers: Dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "url": self.url,
+            "events": list(self.events),
+            "headers": dict(self.headers),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Webhook":
         return cls(**data)
 
 
-@dataclass
+@_model
 class DaemonStatus:
     """Daemon status information."""
     version: str
@@ -316,14 +434,19 @@ class DaemonStatus:
             completed_jobs=data["completed_jobs"],
             failed_jobs=data["failed_jobs"],
             cancelled_jobs=data["cancelled_jobs"],
-            timestamp=datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00")),
+            timestamp=_parse_dt(data["timestamp"]),
         )
 
 
 # Carbon-Aware Models
 
+# Energy model used by the daemon for carbon estimates (providers/carbon):
+# 100 W base load plus 50 W per TB being transferred.
+_BASE_POWER_W = 100.0
+_TRANSFER_POWER_W_PER_TB = 50.0
+
 
-@dataclass
+@_model
 class CarbonForecast:
     """Carbon intensity forecast."""
     time: datetime
@@ -333,13 +456,13 @@ class CarbonForecast:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CarbonForecast":
         return cls(
-            time=datetime.fromisoformat(data["time"].replace("Z", "+00:00")),
+            time=_parse_dt(data["time"]),
             intensity_gco2_kwh=data["intensity_gco2_kwh"],
             quality=data["quality"],
         )
 
 
-@dataclass
+@_model
 class CarbonStatus:
     """Grid carbon status."""
     zone: str
@@ -355,9 +478,8 @@ class CarbonStatus:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CarbonStatus":
         forecast = [CarbonForecast.from_dict(f) for f in data.get("forecast_next_4h", [])]
-        next_optimal = None
-        if data.get("next_optimal_time"):
-            next_optimal = datetime.fromisoformat(data["next_optimal_time"].replace("Z", "+00:00"))
+        next_optimal = data.get("next_optimal_time")
+        next_optimal = _parse_dt(next_optimal) if next_optimal else None
 
         return cls(
             zone=data["zone"],
@@ -368,11 +490,11 @@ class CarbonStatus:
             forecast=forecast,
             reasoning=data["reasoning"],
             quality=data["quality"],
-            timestamp=datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00")),
+            timestamp=_parse_dt(data["timestamp"]),
         )
 
 
-@dataclass
+@_model
 class CarbonReport:
     """Carbon footprint report."""
     operation_id: str
@@ -391,8 +513,8 @@ class CarbonReport:
     def from_dict(cls, data: Dict[str, Any]) -> "CarbonReport":
         return cls(
             operation_id=data["operation_id"],
-            start_time=datetime.fromisoformat(data["start_time"].replace("Z", "+00:00")),
-            end_time=datetime.fromisoformat(data["end_time"].replace("Z", "+00:00")),
+            start_time=_parse_dt(data["start_time"]),
+            end_time=_parse_dt(data["end_time"]),
             duration_hours=data["duration_hours"],
             data_size_gb=data["data_size_gb"],
             energy_kwh=data["energy_kwh"],
@@ -404,7 +526,7 @@ class CarbonReport:
         )
 
 
-@dataclass
+@_model
 class CarbonZone:
     """Carbon zone information."""
     id: str
@@ -424,7 +546,7 @@ class CarbonZone:
         )
 
 
-@dataclass
+@_model
 class CarbonEstimate:
     """Carbon savings estimate."""
     current_intensity_gco2_kwh: float
@@ -441,9 +563,8 @@ class CarbonEstimate:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CarbonEstimate":
         forecast = [CarbonForecast.from_dict(f) for f in data.get("forecast", [])]
-        best_time = None
-        if data.get("best_time"):
-            best_time = datetime.fromisoformat(data["best_time"].replace("Z", "+00:00"))
+        best_time = data.get("best_time")
+        best_time = _parse_dt(best_time) if best_time else None
 
         return cls(
             current_intensity_gco2_kwh=data["current_intensity_gco2_kwh"],
@@ -457,3 +578,54 @@ class CarbonEstimate:
             delay_minutes=data.get("delay_minutes"),
             forecast=forecast,
         )
+
+    @classmethod
+    def from_status(
+        cls, status: CarbonStatus, data_size_gb: float, duration_hours: float
+    ) -> "CarbonEstimate":
+        """Derive a savings estimate from an already fetched carbon status.
+
+        Mirrors the daemon's /carbon/estimate computation, which uses the same
+        current intensity and 4-hour forecast that a status response carries.
+        """
+        energy_kwh = (
+            (_BASE_POWER_W + data_size_gb / 1000.0 * _TRANSFER_POWER_W_PER_TB)
+            * duration_hours
+            / 1000.0
+        )
+        current_intensity = status.current_intensity
+        best_intensity = current_intensity
+        best_time = None
+        for f in status.forecast:
+            if f.intensity_gco2_kwh < best_intensity:
+                best_intensity = f.intensity_gco2_kwh
+                best_time = f.time
+
+        current_emissions = energy_kwh * current_intensity / 1000.0
+        best_emissions = energy_kwh * best_intensity / 1000.0
+        savings = current_emissions - best_emissions
+        savings_percent = savings / current_emissions * 100 if current_emissions else 0.0
+
+        delay_minutes = None
+        if best_time is not None:
+            delay_minutes = (best_time - datetime.now(best_time.tzinfo)).total_seconds() / 60
+        if savings > 0:
+            recommendation = (
+                f"Delay {delay_minutes:.0f} minutes to save {savings:.2f} kg CO2 "
+                f"({savings_percent:.0f}% reduction)"
+            )
+        else:
+            recommendation = "Grid is already clean, run job now"
+
+        return cls(
+            current_intensity_gco2_kwh=current_intensity,
+            current_emissions_kg_co2=current_emissions,
+            best_intensity_gco2_kwh=best_intensity,
+            best_emissions_kg_co2=best_emissions,
+            best_time=best_time,
+            savings_kg_co2=savings,
+            savings_percent=savings_percent,
+            recommendation=recommendation,
+            delay_minutes=delay_minutes,
+            forecast=list(status.forecast),
+        )
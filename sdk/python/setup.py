@@ -42,6 +42,23 @@ setup(
             "mypy>=0.990",
             "types-requests",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "compression": [
+            "urllib3>=2.0",
+            "brotli>=1.0.9",
+            "zstandard>=0.18.0",
+        ],
     },
     keywords="vm migration export vmware vsphere aws azure gcp hypervisor kvm libvirt",
     project_urls={
@@ -0,0 +1,46 @@
+"""Tests for the client response cache."""
+
+from hypersdk._cache import ttl_cache
+
+
+class _Client:
+    def __init__(self):
+        self._ttl_cache = {}
+        self.calls = 0
+
+    @ttl_cache(60, maxsize=3)
+    def lookup(self, key):
+        self.calls += 1
+        return {"key": key, "tags": []}
+
+    @ttl_cache(0)
+    def fresh(self):
+        self.calls += 1
+        return self.calls
+
+
+def test_returns_copies_of_cached_values():
+    client = _Client()
+    client.lookup("a")["tags"].append("mutated")
+    assert client.lookup("a") == {"key": "a", "tags": []}
+    assert client.calls == 1
+
+
+def test_evicts_oldest_entry_when_full():
+    client = _Client()
+    for key in "abcd":
+        client.lookup(key)
+    assert len(client._ttl_cache) == 3
+    client.lookup("a")
+    assert client.calls == 5
+
+
+def test_drops_expired_entries_before_evicting():
+    client = _Client()
+    client.fresh()
+    client.lookup("a")
+    client.lookup("b")
+    client.lookup("c")
+    assert [key[0] for key in client._ttl_cache] == ["lookup"] * 3
+    client.lookup("a")
+    assert client.calls == 4
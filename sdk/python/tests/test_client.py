@@ -0,0 +1,487 @@
+"""Tests for the HyperSDK clients against a stub daemon."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hypersdk import APIError, AuthenticationError, HyperSDK, Job, JobDefinition, JobNotFoundError, JobStatus
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Replies with the canned (status, body) registered for each route.
+
+    A route may also be a callable taking the handler (with the decoded
+    request body as ``handler.body``) and returning (status, body) or
+    (status, body, headers). A None body sends an empty reply.
+    """
+
+    routes = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = json.loads(self.rfile.read(length)) if length else None
+        route = self.routes[(self.command, self.path.split("?")[0])]
+        status, body, *extra = route(self) if callable(route) else route
+        if body is None:
+            payload, content_type = b"", None
+        elif isinstance(body, bytes):
+            payload, content_type = body, "text/plain"
+        else:
+            payload, content_type = json.dumps(body).encode(), "application/json"
+        self.send_response(status)
+        for name, value in (extra[0] if extra else {}).items():
+            self.send_header(name, value)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _reply
+    do_POST = _reply
+
+
+@pytest.fixture
+def daemon():
+    """Start a stub daemon and return (base_url, routes)."""
+    routes = {}
+    handler = type("Handler", (_StubHandler,), {"routes": routes})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", routes
+    server.shutdown()
+    server.server_close()
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _async_client(base_url):
+    pytest.importorskip("aiohttp")
+    from hypersdk import AsyncHyperSDK
+
+    return AsyncHyperSDK(base_url)
+
+
+# The daemon encodes an empty job list as {"jobs": null}
+NULL_JOBS = {"jobs": None, "total": 0, "timestamp": "2026-01-01T00:00:00Z"}
+
+
+def test_query_jobs_with_no_matches(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, NULL_JOBS)
+    routes[("GET", "/jobs/query")] = (200, NULL_JOBS)
+    with HyperSDK(base_url) as client:
+        assert client.query_jobs(status=[JobStatus.RUNNING]) == []
+        assert client.list_jobs() == []
+
+
+def test_async_query_jobs_with_no_matches(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, NULL_JOBS)
+    routes[("GET", "/jobs/query")] = (200, NULL_JOBS)
+
+    async def main():
+        async with _async_client(base_url) as client:
+            return (
+                await client.query_jobs(status=[JobStatus.RUNNING]),
+                await client.list_jobs(),
+            )
+
+    assert _run(main()) == ([], [])
+
+
+def test_get_jobs_with_no_known_ids(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, NULL_JOBS)
+    with HyperSDK(base_url) as client:
+        assert client.get_jobs(["nope"]) == []
+
+
+def test_async_get_jobs_with_no_known_ids(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, NULL_JOBS)
+
+    async def main():
+        async with _async_client(base_url) as client:
+            return await client.get_jobs(["zz"])
+
+    assert _run(main()) == []
+
+
+def test_get_jobs_progress_with_no_known_ids(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, NULL_JOBS)
+    with HyperSDK(base_url) as client:
+        assert client.get_jobs_progress(["nope"]) == {}
+
+    async def main():
+        async with _async_client(base_url) as client:
+            return await client.get_jobs_progress(["nope"])
+
+    assert _run(main()) == {}
+
+
+def test_get_jobs_progress(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/query")] = (200, {
+        "jobs": [{
+            "definition": {"id": "job-1", "vm_path": "/dc/vm/a"},
+            "status": "running",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "progress": {"phase": "export", "percent_complete": 40},
+        }],
+        "total": 1,
+    })
+    with HyperSDK(base_url) as client:
+        progress = client.get_jobs_progress(["job-1", "nope"])
+    assert list(progress) == ["job-1"]
+    assert progress["job-1"].percent_complete == 40
+
+
+@pytest.mark.parametrize("transport", ["requests", "httpx"])
+def test_iter_jobs_with_no_jobs(daemon, transport):
+    if transport == "httpx":
+        pytest.importorskip("httpx")
+    base_url, routes = daemon
+    routes[("GET", "/jobs/query")] = (200, NULL_JOBS)
+    with HyperSDK(base_url, transport=transport) as client:
+        assert list(client.iter_jobs()) == []
+
+
+@pytest.mark.parametrize("transport", ["requests", "httpx"])
+def test_get_job_logs_to_sink(daemon, transport):
+    if transport == "httpx":
+        pytest.importorskip("httpx")
+    base_url, routes = daemon
+    log = b"line\n" * 50000
+    routes[("GET", "/jobs/logs/job-1")] = (200, log)
+    routes[("GET", "/jobs/logs/job-2")] = (404, {"error": "job not found"})
+    routes[("GET", "/jobs/logs/job-3")] = (500, {"error": "disk full"})
+    with HyperSDK(base_url, transport=transport) as client:
+        sink = io.BytesIO()
+        assert client.get_job_logs("job-1", sink=sink, chunk_size=4096) is None
+        assert sink.getvalue() == log
+        assert b"".join(client.iter_job_logs("job-1")) == log
+        with pytest.raises(JobNotFoundError):
+            client.get_job_logs("job-2", sink=io.BytesIO())
+        with pytest.raises(APIError, match="disk full"):
+            list(client.iter_job_logs("job-3"))
+
+
+@pytest.mark.parametrize("status, error", [(404, JobNotFoundError), (500, APIError)])
+def test_streamed_error_response_is_closed(daemon, status, error):
+    base_url, routes = daemon
+    routes[("GET", "/jobs/logs/job-1")] = (status, {"error": "nope"})
+    with HyperSDK(base_url) as client:
+        responses = []
+        send = client.session.request
+
+        def record(*args, **kwargs):
+            responses.append(send(*args, **kwargs))
+            return responses[-1]
+
+        client.session.request = record
+        with pytest.raises(error):
+            list(client.iter_job_logs("job-1"))
+    assert responses and responses[0].raw.closed
+
+
+def test_watch_job_backs_off_until_phase_changes(monkeypatch):
+    states = [
+        ("running", "export", 10),
+        ("running", "export", 10),
+        ("running", "export", 20),
+        ("running", "upload", 20),
+        ("completed", "upload", 100),
+    ]
+    client = HyperSDK("http://127.0.0.1:1")
+
+    def get_job(job_id):
+        status, phase, percent = states.pop(0)
+        return Job.from_dict({
+            "definition": {"id": job_id, "vm_path": "/dc/vm/a"},
+            "status": status,
+            "updated_at": "2026-01-01T00:00:00Z",
+            "progress": {"phase": phase, "percent_complete": percent},
+        })
+
+    delays = []
+    monkeypatch.setattr(client, "get_job", get_job)
+    monkeypatch.setattr("hypersdk.client.random.uniform", lambda a, b: 1.0)
+    monkeypatch.setattr("hypersdk.client.time.sleep", delays.append)
+    jobs = list(client.watch_job("job-1", poll_interval=3.0, backoff=2.0))
+    client.close()
+    assert [job.progress.percent_complete for job in jobs] == [10, 20, 20, 100]
+    # Unchanged -> back off; percentage only -> hold; phase change -> reset
+    assert delays == [3.0, 6.0, 6.0, 3.0]
+
+
+def _submit_route(handler):
+    """Accept every job except those whose VM path contains "bad"."""
+    paths = [job["vm_path"] for job in handler.body]
+    if any("bad" in path for path in paths):
+        return 500, {"error": "datastore offline"}
+    return 200, {"accepted": len(paths), "job_ids": [f"id-{p}" for p in paths]}
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 3])
+def test_submit_jobs_merges_batches(daemon, max_concurrent):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/submit")] = _submit_route
+    job_defs = [JobDefinition(vm_path=str(i)) for i in range(5)]
+    with HyperSDK(base_url) as client:
+        job_ids = client.submit_jobs(job_defs, batch_size=2, max_concurrent=max_concurrent)
+    assert job_ids == [f"id-{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 3])
+def test_submit_jobs_reports_partial_results(daemon, max_concurrent):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/submit")] = _submit_route
+    job_defs = [JobDefinition(vm_path=p) for p in ["a", "b", "bad", "c", "d"]]
+    with HyperSDK(base_url) as client:
+        with pytest.raises(APIError, match="datastore offline") as excinfo:
+            client.submit_jobs(job_defs, batch_size=2, max_concurrent=max_concurrent)
+    expected = ["id-a", "id-b"] if max_concurrent == 1 else ["id-a", "id-b", "id-d"]
+    assert excinfo.value.partial == expected
+
+
+def test_cancel_jobs_merges_batches_and_reports_partial_results(daemon):
+    base_url, routes = daemon
+
+    def cancel(handler):
+        ids = handler.body["job_ids"]
+        if "bad" in ids:
+            return 500, {"error": "daemon busy"}
+        return 200, {"cancelled": ids[:1], "failed": ids[1:], "errors": {i: "done" for i in ids[1:]}}
+
+    routes[("POST", "/jobs/cancel")] = cancel
+    with HyperSDK(base_url) as client:
+        assert client.cancel_jobs(["a", "b", "c"], batch_size=2) == {
+            "cancelled": ["a", "c"], "failed": ["b"], "errors": {"b": "done"},
+        }
+        with pytest.raises(APIError) as excinfo:
+            client.cancel_jobs(["a", "b", "bad"], batch_size=2)
+    assert excinfo.value.partial == {"cancelled": ["a"], "failed": ["b"], "errors": {"b": "done"}}
+
+
+def test_cancel_job_with_null_result_lists(daemon):
+    base_url, routes = daemon
+    routes[("POST", "/jobs/cancel")] = (200, {"cancelled": None, "failed": ["job-1"], "errors": None})
+    with HyperSDK(base_url) as client:
+        with pytest.raises(APIError, match="Unknown error"):
+            client.cancel_job("job-1")
+
+    async def main():
+        async with _async_client(base_url) as client:
+            routes[("POST", "/jobs/cancel")] = (200, {"cancelled": ["job-1"], "failed": None})
+            return await client.cancel_job("job-1")
+
+    assert _run(main()) is True
+
+
+def test_watch_job_reuses_one_job(daemon, monkeypatch):
+    base_url, routes = daemon
+    states = iter([("running", 10), ("running", 10), ("running", 50), ("completed", 100)])
+
+    def job_route(handler):
+        status, percent = next(states)
+        return 200, {
+            "definition": {"id": "job-1", "vm_path": "/dc/vm/a"},
+            "status": status,
+            "updated_at": "2026-01-01T00:00:00Z",
+            "progress": {"phase": "export", "percent_complete": percent},
+        }
+
+    routes[("GET", "/jobs/job-1")] = job_route
+    monkeypatch.setattr("hypersdk.client.time.sleep", lambda delay: None)
+    with HyperSDK(base_url) as client:
+        seen = [
+            (job, job.status, job.progress.percent_complete)
+            for job in client.watch_job("job-1", reuse=True)
+        ]
+    assert len({id(job) for job, _, _ in seen}) == 1
+    assert [state[1:] for state in seen] == [
+        (JobStatus.RUNNING, 10), (JobStatus.RUNNING, 50), (JobStatus.COMPLETED, 100),
+    ]
+
+
+@pytest.mark.parametrize("data_size_gb, duration_hours", [(0, 2.0), (500.0, -1), (500.0, float("nan"))])
+def test_estimate_carbon_savings_rejects_non_positive_input(data_size_gb, duration_hours):
+    with HyperSDK("http://127.0.0.1:1") as client:
+        with pytest.raises(APIError, match="must be positive") as excinfo:
+            client.estimate_carbon_savings("US-CAL-CISO", data_size_gb, duration_hours)
+    assert excinfo.value.status_code == 400
+
+
+def test_get_carbon_status_batch_keeps_per_zone_errors(daemon):
+    base_url, routes = daemon
+
+    def carbon_status(handler):
+        zone = handler.body["zone"]
+        if zone == "DE":
+            return 503, {"error": "provider unavailable"}
+        return 200, {
+            "zone": zone,
+            "current_intensity": 120.0,
+            "renewable_percent": 60.0,
+            "optimal_for_backup": True,
+            "reasoning": "clean grid",
+            "quality": "good",
+            "timestamp": "2026-01-01T00:00:00Z",
+        }
+
+    routes[("POST", "/carbon/status")] = carbon_status
+    with HyperSDK(base_url) as client:
+        statuses = client.get_carbon_status_batch(["US-CAL-CISO", "DE", "SE"])
+    assert list(statuses) == ["US-CAL-CISO", "DE", "SE"]
+    assert statuses["SE"].current_intensity == 120.0
+    assert isinstance(statuses["DE"], APIError)
+    assert statuses["DE"].status_code == 503
+
+
+@pytest.mark.parametrize("transport", ["requests", "httpx"])
+def test_streamed_error_body_read_is_bounded(daemon, transport):
+    if transport == "httpx":
+        pytest.importorskip("httpx")
+    from hypersdk.client import _MAX_ERROR_BODY
+
+    base_url, routes = daemon
+    routes[("GET", "/jobs/logs/job-1")] = (502, b"x" * (16 * _MAX_ERROR_BODY))
+    with HyperSDK(base_url, transport=transport) as client:
+        responses = []
+        send = client.session.request
+
+        def record(*args, **kwargs):
+            responses.append(send(*args, **kwargs))
+            return responses[-1]
+
+        client.session.request = record
+        with pytest.raises(APIError) as excinfo:
+            list(client.iter_job_logs("job-1"))
+    assert excinfo.value.status_code == 502
+    response = responses[0]
+    read = response.raw.tell() if transport == "requests" else response.num_bytes_downloaded
+    assert read <= 2 * _MAX_ERROR_BODY
+
+
+def _job_route(valid_tokens):
+    """Serve job-1 to requests bearing one of ``valid_tokens``, else 401."""
+
+    def route(handler):
+        if handler.headers.get("Authorization") not in valid_tokens:
+            return 401, {"error": "token expired"}
+        return 200, {
+            "definition": {"id": "job-1", "vm_path": "/dc/vm/a"},
+            "status": "running",
+            "updated_at": "2026-01-01T00:00:00Z",
+        }
+
+    return route
+
+
+def test_401_replays_request_with_body_and_headers(daemon):
+    base_url, routes = daemon
+    logins, submits = [], []
+
+    def login(handler):
+        logins.append(handler.body)
+        return 200, {"token": f"t{len(logins)}"}
+
+    def submit(handler):
+        submits.append((handler.headers["Authorization"], handler.headers["Content-Type"], handler.body))
+        if handler.headers["Authorization"] == "Bearer t1":
+            return 401, {"error": "token expired"}
+        return 200, {"accepted": 1, "job_ids": ["job-1"]}
+
+    routes[("POST", "/api/login")] = login
+    routes[("POST", "/jobs/submit")] = submit
+    with HyperSDK(base_url) as client:
+        client.login("admin", "secret")
+        assert client.submit_job(JobDefinition(vm_path="/dc/vm/a")) == "job-1"
+    assert logins == [{"username": "admin", "password": "secret"}] * 2
+    assert [s[0] for s in submits] == ["Bearer t1", "Bearer t2"]
+    assert submits[0][1:] == submits[1][1:] == ("application/json", {
+        "vm_path": "/dc/vm/a", "compress": False, "thin": False, "insecure": False,
+        "format": "ovf",
+    })
+
+
+def test_concurrent_401s_share_one_refresh(daemon):
+    base_url, routes = daemon
+    valid = {"Bearer fresh"}
+    routes[("GET", "/jobs/job-1")] = _job_route(valid)
+    refreshes = []
+
+    def refresh():
+        refreshes.append(None)
+        time.sleep(0.2)  # Let the other threads pile up on the lock
+        return "fresh"
+
+    with HyperSDK(base_url, token_refresh_callback=refresh) as client:
+        client._set_token("stale")
+        start = threading.Barrier(8)
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(client.get_job("job-1").definition.id)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert results == ["job-1"] * 8
+    assert len(refreshes) == 1
+
+
+def test_401_from_login_is_not_retried(daemon):
+    base_url, routes = daemon
+    attempts = []
+
+    def login(handler):
+        attempts.append(handler.body)
+        return 401, {"error": "bad credentials"}
+
+    routes[("POST", "/api/login")] = login
+    refreshes = []
+    with HyperSDK(base_url, token_refresh_callback=lambda: refreshes.append(None)) as client:
+        with pytest.raises(AuthenticationError):
+            client.login("admin", "wrong")
+    assert len(attempts) == 1
+    assert refreshes == []
+
+
+def test_capabilities_revalidated_by_etag(daemon, tmp_path):
+    base_url, routes = daemon
+    caps = {"formats": ["ova", "ovf"], "methods": ["govc"]}
+    requests_seen = []
+
+    def capabilities(handler):
+        requests_seen.append(handler.headers.get("If-None-Match"))
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, caps, {"ETag": '"v1"'}
+
+    routes[("GET", "/capabilities")] = capabilities
+    with HyperSDK(base_url, cache_dir=str(tmp_path)) as client:
+        assert client.capabilities() == caps
+        assert client.capabilities() == caps
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A new client picks the ETag up from cache_dir and gets a 304
+    with HyperSDK(base_url, cache_dir=str(tmp_path)) as client:
+        assert client.capabilities() == caps
+    assert requests_seen == [None, '"v1"', '"v1"']
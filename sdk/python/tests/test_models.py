@@ -0,0 +1,72 @@
+"""Tests for the HyperSDK data models."""
+
+import pytest
+
+from hypersdk.models import ExportFormat, Job, JobDefinition, JobStatus, ScheduledJob
+
+
+def _job_data(**overrides):
+    data = {
+        "definition": {"id": "job-1", "vm_path": "/dc/vm/a"},
+        "status": "running",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "progress": {"phase": "export", "percent_complete": 40},
+    }
+    data.update(overrides)
+    return data
+
+
+def test_update_from_dict_matches_from_dict():
+    job = Job.from_dict(_job_data(result={
+        "vm_name": "a",
+        "output_dir": "/out",
+        "ovf_path": "/out/a.ovf",
+        "files": [],
+        "total_size": 1,
+        "duration": 2,
+        "success": True,
+    }))
+    progress = job.progress
+
+    update = _job_data(status="failed", progress={"phase": "cleanup"}, error="boom")
+    job.update_from_dict(update)
+
+    assert job == Job.from_dict(update)
+    assert job.result is None
+    assert job.progress is progress
+
+
+def test_update_from_dict_rejects_progress_without_phase():
+    job = Job.from_dict(_job_data())
+    update = _job_data(status="completed", progress={"percent_complete": 100})
+
+    with pytest.raises(TypeError):
+        Job.from_dict(update)
+    with pytest.raises(TypeError):
+        job.update_from_dict(update)
+    assert job.status is JobStatus.RUNNING
+    assert job.progress.phase == "export"
+
+
+def test_scheduled_job_keeps_unknown_template_values():
+    scheduled = ScheduledJob.from_dict({
+        "name": "nightly",
+        "schedule": "0 2 * * *",
+        "job_template": {"vm_path": "/dc/vm/a", "format": "vhdx", "export_method": "nfc"},
+    })
+    template = scheduled.job_template
+    assert template.format == "vhdx"
+    assert template.export_method == "nfc"
+    assert template.to_dict()["format"] == "vhdx"
+
+    known = ScheduledJob.from_dict({
+        "name": "nightly",
+        "schedule": "0 2 * * *",
+        "job_template": {"vm_path": "/dc/vm/a", "format": "ova"},
+    })
+    assert known.job_template.format is ExportFormat.OVA
+
+
+def test_job_definition_rejects_unknown_format_by_default():
+    with pytest.raises(ValueError):
+        JobDefinition.from_dict({"vm_path": "/dc/vm/a", "format": "vhdx"})